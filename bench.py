@@ -0,0 +1,231 @@
+import argparse
+import json
+import math
+import os
+import statistics
+import time
+
+from tuner.uci_engine import EngineError, UciEngine
+
+# Benchmark runner. Every engine binary (e.g. the VINTAGE/POPCNT/AVX2 builds of
+# build_versions.py) is driven over UCI: the built-in bench command gives the
+# single-threaded node count and speed, and a suite of positions is searched to a
+# fixed depth for every combination of thread count and Hash size. Every
+# measurement is repeated to get a 95 % confidence interval, the results are saved
+# as JSON and can be compared against an earlier run to catch regressions.
+
+SUITE = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "r3k2r/2pb1ppp/2pp1q2/p7/1nP1B3/1P2P3/P2N1PPP/R2QK2R w KQkq a6 0 14",
+    "4rrk1/2p1b1p1/p1p3q1/4p3/2P2n1p/1P1NR2P/PB3PP1/3R1QK1 b - - 2 24",
+    "r3qbrk/6p1/2b2pPp/p3pP1Q/PpPpP2P/3P1B2/2PB3K/R5R1 w - - 16 42",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "8/3k4/8/8/3PK3/8/8/8 w - - 0 1",
+]
+
+# Two-sided 95 % quantiles of Student's t distribution by degrees of freedom
+T_95 = {1: 12.71, 2: 4.30, 3: 3.18, 4: 2.78, 5: 2.57, 6: 2.45, 7: 2.36, 8: 2.31, 9: 2.26,
+        10: 2.23, 12: 2.18, 15: 2.13, 20: 2.09, 30: 2.04}
+
+
+def t_95(df):
+    return T_95[max(k for k in T_95 if k <= df)] if df < 60 else 1.96
+
+
+def summary(values):
+    mean = statistics.mean(values)
+    if len(values) < 2:
+        return {'mean': mean, 'stdev': 0.0, 'ci95': 0.0, 'runs': values}
+    stdev = statistics.stdev(values)
+    return {'mean': mean, 'stdev': stdev, 'ci95': t_95(len(values) - 1) * stdev / math.sqrt(len(values)), 'runs': values}
+
+
+def read_positions(path):
+    with open(path, 'r') as file:
+        # EPD lines may carry a label after the FEN, e.g. "... w - - [0.5]"
+        return [line.split('[')[0].strip() for line in file if line.strip()]
+
+
+def run_bench_command(path, depth, options, repeat):
+    nodes, nps = [], []
+    for _ in range(repeat):
+        with UciEngine(path, options) as engine:
+            command = f'bench {depth}' if depth else 'bench'
+            engine.send(command)
+            # The last line is the answer to isready, so a binary without the bench
+            # command cannot make this wait until the timeout
+            engine.send('isready')
+            lines = engine.wait_for('readyok', timeout=3600)
+        if not any(line.startswith('Nodes searched') for line in lines) or not any(line.startswith('Nodes/second') for line in lines):
+            output = '\n'.join(lines[:-1]) or '(no output)'
+            raise EngineError(f"{path} gave no bench result for '{command}', does it have the bench command?\n{output}")
+        for line in lines:
+            if line.startswith('Nodes searched'):
+                nodes.append(int(line.split(':')[1]))
+            elif line.startswith('Nodes/second'):
+                nps.append(int(line.split(':')[1]))
+    return {'nodes': nodes[0], 'deterministic': len(set(nodes)) == 1, 'nps': summary(nps)}
+
+
+def run_suite(path, positions, depth, threads, hash_mb, options, repeat):
+    options = dict(options, Threads=threads, Hash=hash_mb)
+    runs = {'nps': [], 'nodes': [], 'wall_time': [], 'hashfull': []}
+    depth_times = {}
+    with UciEngine(path, options) as engine:
+        for _ in range(repeat):
+            total_nodes, total_ms, main_nodes, hashfull = 0, 0, 0, []
+            start = time.time()
+            for fen in positions:
+                engine.new_game()
+                engine.position(fen)
+                _, infos = engine.go(timeout=3600, depth=depth)
+                infos = [info for info in infos if 'depth' in info and 'nps' in info]
+                if not infos:
+                    continue
+                last = infos[-1]
+                # nodes is the main thread only, nps counts all threads
+                total_nodes += last['nps'] * last['time'] / 1000
+                total_ms += last['time']
+                main_nodes += last['nodes']
+                hashfull.append(last.get('hashfull', 0))
+                for info in infos:
+                    depth_times.setdefault(info['depth'], []).append(info['time'])
+            runs['nps'].append(total_nodes * 1000 / max(total_ms, 1))
+            runs['nodes'].append(main_nodes)
+            runs['wall_time'].append(time.time() - start)
+            runs['hashfull'].append(statistics.mean(hashfull) if hashfull else 0)
+
+    result = {key: summary(values) for key, values in runs.items()}
+    # Mean time in ms to finish each iteration, over positions and repetitions
+    result['depth_time'] = {str(d): statistics.mean(t) for d, t in sorted(depth_times.items())}
+    return result
+
+
+def slower(new, base, threshold):
+    # Relative change of the mean, and whether it is a drop larger than both the
+    # threshold and the noise of the two measurements
+    change = (new['mean'] - base['mean']) / max(base['mean'], 1e-9)
+    significant = abs(new['mean'] - base['mean']) > new['ci95'] + base['ci95']
+    return change, change < -threshold and significant
+
+
+def more_nodes(label, new_nodes, base_nodes, threshold):
+    # Prints a changed node count, and whether it grew by more than the threshold
+    if new_nodes == base_nodes:
+        return False
+    print(f"  {label} nodes changed: {base_nodes:.0f} -> {new_nodes:.0f} ({(new_nodes - base_nodes) / max(base_nodes, 1):+.2%})")
+    return new_nodes > base_nodes * (1 + threshold)
+
+
+def compare(results, baseline, threshold):
+    pairs = [(name, name) for name in results if name in baseline]
+    if not pairs and len(results) == 1 and len(baseline) == 1:
+        pairs = [(next(iter(results)), next(iter(baseline)))]
+
+    regressions = []
+    for name, base_name in pairs:
+        new, base = results[name], baseline[base_name]
+        print(f"\n{name} vs {base_name}")
+
+        if 'bench' in new and 'bench' in base:
+            new_nodes, base_nodes = new['bench']['nodes'], base['bench']['nodes']
+            if more_nodes('bench', new_nodes, base_nodes, threshold):
+                regressions.append(f'{name}: bench nodes {base_nodes} -> {new_nodes}')
+            change, regressed = slower(new['bench']['nps'], base['bench']['nps'], threshold)
+            print(f"  bench nps: {base['bench']['nps']['mean']:.0f} -> {new['bench']['nps']['mean']:.0f} ({change:+.2%})"
+                  + ('  REGRESSION' if regressed else ''))
+            if regressed:
+                regressions.append(f'{name}: bench nps {change:+.2%}')
+
+        for config, stats in new.get('suite', {}).items():
+            if config not in base.get('suite', {}):
+                continue
+            change, regressed = slower(stats['nps'], base['suite'][config]['nps'], threshold)
+            print(f"  {config}: nps {base['suite'][config]['nps']['mean']:.0f} -> {stats['nps']['mean']:.0f} ({change:+.2%})"
+                  + ('  REGRESSION' if regressed else ''))
+            if regressed:
+                regressions.append(f'{name} {config}: nps {change:+.2%}')
+
+            # Node counts only repeat with one thread
+            if config.split()[0] == 'threads=1':
+                new_nodes, base_nodes = stats['nodes']['mean'], base['suite'][config]['nodes']['mean']
+                if more_nodes(config, new_nodes, base_nodes, threshold):
+                    regressions.append(f'{name} {config}: nodes {base_nodes:.0f} -> {new_nodes:.0f}')
+    return regressions
+
+
+def parse_options(values):
+    options = {}
+    for value in values:
+        name, _, option = value.partition('=')
+        options[name] = option
+    return options
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Lambergar binaries over UCI.')
+    parser.add_argument('engines', type=str, nargs='+', help='Engine binaries')
+    parser.add_argument('--positions', type=str, default=None, help='EPD or FEN file with the position suite')
+    parser.add_argument('--depth', type=int, default=12, help='Search depth for the position suite')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1], help='Thread counts to test')
+    parser.add_argument('--hash', type=int, nargs='+', default=[128], help='Hash sizes in MB to test')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions of every measurement')
+    parser.add_argument('--bench-depth', type=int, default=0, help='Depth of the bench command (0 = engine default)')
+    parser.add_argument('--no-bench', action='store_true', help='Skip the bench command')
+    parser.add_argument('--no-suite', action='store_true', help='Skip the position suite')
+    parser.add_argument('--option', type=str, action='append', default=[], help='UCI option as Name=Value, e.g. UseNNUE=false')
+    parser.add_argument('--output', type=str, default='bench_results.json', help='File for the results')
+    parser.add_argument('--compare', type=str, default=None, help='Earlier results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.03, help='Relative slowdown reported as a regression')
+    args = parser.parse_args()
+
+    positions = read_positions(args.positions) if args.positions else SUITE
+    options = parse_options(args.option)
+    results = {}
+
+    for path in args.engines:
+        name = os.path.splitext(os.path.basename(path))[0]
+        results[name] = {'path': path}
+
+        if not args.no_bench:
+            bench = run_bench_command(path, args.bench_depth, options, args.repeat)
+            results[name]['bench'] = bench
+            print(f"{name} bench: {bench['nodes']} nodes, {bench['nps']['mean']:.0f} +- {bench['nps']['ci95']:.0f} nps"
+                  + ('' if bench['deterministic'] else ' (node count differs between runs)'))
+
+        if not args.no_suite:
+            results[name]['suite'] = {}
+            for threads in args.threads:
+                for hash_mb in args.hash:
+                    config = f'threads={threads} hash={hash_mb}'
+                    stats = run_suite(path, positions, args.depth, threads, hash_mb, options, args.repeat)
+                    results[name]['suite'][config] = stats
+                    print(f"{name} {config}: {stats['nps']['mean']:.0f} +- {stats['nps']['ci95']:.0f} nps, "
+                          f"{stats['wall_time']['mean']:.2f}s, hashfull {stats['hashfull']['mean']:.0f}")
+
+    report = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'settings': {'depth': args.depth, 'bench_depth': args.bench_depth, 'repeat': args.repeat,
+                     'positions': len(positions), 'options': options},
+        'engines': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+        if (baseline['settings']['depth'], baseline['settings']['bench_depth'], baseline['settings']['positions']) != (args.depth, args.bench_depth, len(positions)):
+            print("Warning: baseline was measured with a different depth or position suite")
+        regressions = compare(results, baseline['engines'], args.threshold)
+        if regressions:
+            print("\nRegressions:\n  " + '\n  '.join(regressions))
+            raise SystemExit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
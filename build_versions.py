@@ -1,41 +1,38 @@
-import subprocess
+import argparse
+import hashlib
+import json
 import os
 import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Release builds. Every target is built by its own zig process with its own prefix
+# and cache directory, so the builds can run concurrently, and a target is skipped
+# when its sources, target and CPU are the same as for the binary already in the
+# binaries directory.
+
+# Name suffix, zig target and CPU of every release binary
+TARGETS = [
+    # Windows versions
+    {'name': 'x86_64-win-VINTAGE', 'target': 'x86_64-windows', 'cpu': 'x86_64'},
+    {'name': 'x86_64-win-POPCNT', 'target': 'x86_64-windows', 'cpu': 'x86_64_v2'},
+    {'name': 'x86_64-win-AVX2', 'target': 'x86_64-windows', 'cpu': 'x86_64_v3'},
+    {'name': 'x86_64-win-AVX-512', 'target': 'x86_64-windows', 'cpu': 'x86_64_v4'},
+    # Linux versions
+    {'name': 'x86_64-linux-VINTAGE', 'target': 'x86_64-linux', 'cpu': 'x86_64'},
+    {'name': 'x86_64-linux-POPCNT', 'target': 'x86_64-linux', 'cpu': 'x86_64_v2'},
+    {'name': 'x86_64-linux-AVX2', 'target': 'x86_64-linux', 'cpu': 'x86_64_v3'},
+    #{'name': 'x86_64-linux-AVX-512', 'target': 'x86_64-linux', 'cpu': 'x86_64_v4'},
+    # Raspberry Pi version
+    {'name': 'aarch64-linux', 'target': 'aarch64-linux', 'cpu': None},
+]
+
+STATE_FILE = 'build_state.json'
+REPORT_FILE = 'build_report.json'
+CACHE_DIR = os.path.join('.zig-cache', 'release')
 
-def rename_and_move_file(command, bin_dir):
-
-    start = command.find('--prefix "') + len('--prefix "')
-    end = command.find('"', start)
-    directory = command[start:end]
-    command = command[start:end]
-
-    print(directory)
-
-    if directory is not None:
-        # Change to the specified directory and then to the 'bin' subdirectory
-        os.chdir(os.path.join(directory, 'bin'))
-
-        # Check if the command contains 'win' or 'linux'
-        if 'win' in command and os.path.exists('lambergar.exe'):
-            # Rename 'lambergar.exe'
-            os.rename('lambergar.exe', f'{command}.exe')
-            if not os.path.exists(bin_dir):
-                os.makedirs(bin_dir)            
-            # Move the new file to the specified bin_dir
-            shutil.move(f'{command}.exe', os.path.join(bin_dir, f'{command}.exe'))
-        elif 'linux' in command and os.path.exists('lambergar'):
-            # Rename 'lambergar'
-            os.rename('lambergar', command)
-            if not os.path.exists(bin_dir):
-                os.makedirs(bin_dir)            
-            # Move the new file to the specified bin_dir
-            shutil.move(command, os.path.join(bin_dir, command))
-
-        # Delete the 'bin' directory and the command directory
-        os.chdir('..')  # Go up one directory
-        shutil.rmtree('bin')  # Delete the 'bin' directory
-        os.chdir('..')  # Go up one directory
-        shutil.rmtree(directory)  # Delete the command directory
 
 def extract_version(filename):
     with open(filename, 'r') as file:
@@ -45,51 +42,138 @@ def extract_version(filename):
                 end = line.find('"', start)
                 version = line[start:end-2]
                 return version
-            
-def build_ver(command, bin_dir):
-    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE)
-    stdout, stderr = process.communicate()
-    if process.returncode != 0:
-        print(f"Error occurred: {stderr}")
-    else:
-        print(stdout)
-    rename_and_move_file(command, bin_dir)
 
-version = extract_version('./src/uci.zig')
-print(f"Version: {version}")
 
-bin_dir = f'..\\..\\binaries'
+def zig_version():
+    return subprocess.run(['zig', 'version'], capture_output=True, text=True, check=True).stdout.strip()
+
 
-# Windows versions
-command = f'zig build -Doptimize=ReleaseFast -Dcpu=x86_64 --prefix "lambergar-{version}-x86_64-win-VINTAGE"'
-build_ver(command, bin_dir)
+def sources_hash():
+    # Everything the compiler reads: build script, Zig sources and the embedded network
+    digest = hashlib.sha256()
+    files = ['build.zig', 'build.zig.zon']
+    for root, dirs, names in os.walk('src'):
+        dirs.sort()
+        files += [os.path.join(root, name) for name in sorted(names)]
+    for path in files:
+        if os.path.isfile(path):
+            digest.update(path.replace(os.sep, '/').encode() + b'\n')
+            with open(path, 'rb') as file:
+                digest.update(file.read())
+    return digest.hexdigest()
 
-command = f'zig build -Doptimize=ReleaseFast -Dcpu=x86_64_v2 --prefix "lambergar-{version}-x86_64-win-POPCNT"'
-build_ver(command, bin_dir)
 
-command = f'zig build -Doptimize=ReleaseFast -Dcpu=x86_64_v3 --prefix "lambergar-{version}-x86_64-win-AVX2"'
-build_ver(command, bin_dir)
+def artifact_name(version, target):
+    name = f"lambergar-{version}-{target['name']}"
+    return name + '.exe' if 'windows' in target['target'] else name
 
-command = f'zig build -Doptimize=ReleaseFast -Dcpu=x86_64_v4 --prefix "lambergar-{version}-x86_64-win-AVX-512"'
-build_ver(command, bin_dir)
 
-# Linux versions
-command = f'zig build -Dtarget=x86_64-linux -Doptimize=ReleaseFast -Dcpu=x86_64 --prefix "lambergar-{version}-x86_64-linux-VINTAGE"'
-build_ver(command, bin_dir)
+def build_command(target, prefix, cache_dir):
+    command = ['zig', 'build', f"-Dtarget={target['target']}", '-Doptimize=ReleaseFast']
+    if target['cpu']:
+        command.append(f"-Dcpu={target['cpu']}")
+    return command + ['--prefix', prefix, '--cache-dir', cache_dir]
 
-command = f'zig build -Dtarget=x86_64-linux -Doptimize=ReleaseFast -Dcpu=x86_64_v2 --prefix "lambergar-{version}-x86_64-linux-POPCNT"'
-build_ver(command, bin_dir)
 
-command = f'zig build -Dtarget=x86_64-linux -Doptimize=ReleaseFast -Dcpu=x86_64_v3 --prefix "lambergar-{version}-x86_64-linux-AVX2"'
-build_ver(command, bin_dir)
+def build_target(target, version, fingerprint, bin_dir, work_dir):
+    # Any error is reported as a failed target, so the other targets are still recorded
+    name = artifact_name(version, target)
+    try:
+        return run_build(target, name, fingerprint, bin_dir, work_dir)
+    except Exception as e:
+        return {'target': target['name'], 'artifact': name, 'status': 'failed', 'wall_time': 0.0,
+                'error': f'{type(e).__name__}: {e}'}
 
-# Raspberry Pi version 
-command = f'zig build -Dtarget=aarch64-linux -Doptimize=ReleaseFast --prefix "lambergar-{version}-aarch64-linux"'
-build_ver(command, bin_dir)
 
-#command = f'zig build -Dtarget=x86_64-linux -Doptimize=ReleaseFast -Dcpu=x86_64_v4 --prefix "lambergar-{version}-x86_64-linux-AVX-512"'
-#build_ver(command, bin_dir)
+def run_build(target, name, fingerprint, bin_dir, work_dir):
+    prefix = os.path.join(work_dir, target['name'])
+    # The cache is kept between runs, so a changed target only recompiles what changed
+    command = build_command(target, prefix, os.path.join(CACHE_DIR, target['name']))
+
+    start = time.time()
+    process = subprocess.run(command, capture_output=True, text=True)
+    report = {'target': target['name'], 'artifact': name, 'command': ' '.join(command),
+              'wall_time': round(time.time() - start, 2)}
+    if process.returncode != 0:
+        report.update(status='failed', error=process.stderr.strip())
+        return report
+
+    binary = os.path.join(prefix, 'bin', 'lambergar.exe' if name.endswith('.exe') else 'lambergar')
+    shutil.move(binary, os.path.join(bin_dir, name))
+    shutil.rmtree(prefix)
+    report.update(status='built', fingerprint=fingerprint, size=os.path.getsize(os.path.join(bin_dir, name)))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the release binaries of Lambergar.')
+    parser.add_argument('--bin-dir', type=str, default='binaries', help='Directory for the binaries')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Number of concurrent builds')
+    parser.add_argument('--targets', type=str, nargs='*', help='Build only these targets, e.g. x86_64-linux-AVX2')
+    parser.add_argument('--force', action='store_true', help='Build targets that are up to date too')
+    args = parser.parse_args()
+
+    version = extract_version('./src/uci.zig')
+    print(f"Version: {version}")
+
+    unknown = [name for name in args.targets or [] if name not in [t['name'] for t in TARGETS]]
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(unknown)} (known: {', '.join(t['name'] for t in TARGETS)})")
+    targets = [t for t in TARGETS if not args.targets or t['name'] in args.targets]
+    os.makedirs(args.bin_dir, exist_ok=True)
+    state_path = os.path.join(args.bin_dir, STATE_FILE)
+    state = {}
+    if os.path.exists(state_path):
+        with open(state_path, 'r') as file:
+            state = json.load(file)
+
+    base = f'{zig_version()} {sources_hash()}'
+    fingerprints = {t['name']: hashlib.sha256(f"{base} {t['target']} {t['cpu']}".encode()).hexdigest() for t in targets}
+
+    reports, pending = [], []
+    for target in targets:
+        name = artifact_name(version, target)
+        if not args.force and state.get(name) == fingerprints[target['name']] and os.path.exists(os.path.join(args.bin_dir, name)):
+            reports.append({'target': target['name'], 'artifact': name, 'status': 'skipped', 'wall_time': 0.0,
+                            'size': os.path.getsize(os.path.join(args.bin_dir, name))})
+            print(f"{name} is up to date")
+        else:
+            pending.append(target)
+
+    start = time.time()
+    work_dir = tempfile.mkdtemp(prefix='lambergar-build-', dir='.')
+    try:
+        with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as executor:
+            futures = [executor.submit(build_target, t, version, fingerprints[t['name']], args.bin_dir, work_dir) for t in pending]
+            for future in futures:
+                report = future.result()
+                reports.append(report)
+                if report['status'] == 'built':
+                    state[report['artifact']] = report.pop('fingerprint')
+                    print(f"{report['artifact']}: {report['wall_time']:.1f}s, {report['size']} bytes")
+                else:
+                    state.pop(report['artifact'], None)
+                    print(f"{report['artifact']} failed:\n{report['error']}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(state_path, 'w') as file:
+        json.dump(state, file, indent=2)
+
+    order = [t['name'] for t in targets]
+    reports.sort(key=lambda report: order.index(report['target']))
+    with open(os.path.join(args.bin_dir, REPORT_FILE), 'w') as file:
+        json.dump({'version': version, 'wall_time': round(time.time() - start, 2), 'targets': reports}, file, indent=2)
+
+    failed = [report['target'] for report in reports if report['status'] == 'failed']
+    print(f"Built {sum(report['status'] == 'built' for report in reports)} of {len(targets)} targets in {time.time() - start:.1f}s")
+    if failed:
+        raise SystemExit(f"Failed targets: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
 
 """
 NO COMMENT ;)
-"""
\ No newline at end of file
+"""
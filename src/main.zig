@@ -8,10 +8,28 @@ pub fn main() !void {
     const allocator = std.heap.c_allocator;
 
     if (tune) {
+        // lambergar [input.epd] [output dir] [start byte] [end byte]
+        const args = try std.process.argsAlloc(allocator);
+        defer std.process.argsFree(allocator, args);
+
+        const in_path = if (args.len > 1) args[1] else "quiet-labeled.epd";
+        const out_path = if (args.len > 2) args[2] else "data";
+        const start: u64 = if (args.len > 3) try std.fmt.parseInt(u64, args[3], 10) else 0;
+        const end: ?u64 = if (args.len > 4) try std.fmt.parseInt(u64, args[4], 10) else null;
+
         var tuner_instance = tuner.Tuner.new();
         tuner_instance.init();
-        try tuner_instance.convertDataset();
+        try tuner_instance.convertDataset(in_path, out_path, start, end);
     } else {
-        try uci.uci_loop(allocator);
+        const args = try std.process.argsAlloc(allocator);
+        defer std.process.argsFree(allocator, args);
+
+        // lambergar bench [depth]
+        if (args.len > 1 and std.mem.eql(u8, args[1], "bench")) {
+            const depth: u32 = if (args.len > 2) try std.fmt.parseInt(u32, args[2], 10) else uci.BENCH_DEPTH;
+            try uci.run_bench(depth);
+        } else {
+            try uci.uci_loop(allocator);
+        }
     }
 }
@@ -14,6 +14,43 @@ const Evaluation = evaluation.Evaluation;
 
 const NPIECE_TYPES = position.NPIECE_TYPES;
 
+pub const Field = struct {
+    name: []const u8,
+    shape: []const usize,
+};
+
+// Layout of the features of one color, in the order the probe arrays are stored
+pub const FIELDS = [_]Field{
+    .{ .name = "MAT", .shape = &.{NPIECE_TYPES} },
+    .{ .name = "PSQT", .shape = &.{ NPIECE_TYPES, 64 } },
+    .{ .name = "PASSED", .shape = &.{64} },
+    .{ .name = "ISOLATED", .shape = &.{8} },
+    .{ .name = "BLOCKED", .shape = &.{8} },
+    .{ .name = "SUPPORTED", .shape = &.{8} },
+    .{ .name = "PHAL", .shape = &.{8} },
+    .{ .name = "KN_MOB", .shape = &.{9} },
+    .{ .name = "BISH_MOB", .shape = &.{14} },
+    .{ .name = "ROOK_MOB", .shape = &.{15} },
+    .{ .name = "QN_MOB", .shape = &.{28} },
+    .{ .name = "P_ATT", .shape = &.{6} },
+    .{ .name = "KN_ATT", .shape = &.{6} },
+    .{ .name = "BISH_ATT", .shape = &.{6} },
+    .{ .name = "ROOK_ATT", .shape = &.{6} },
+    .{ .name = "QN_ATT", .shape = &.{6} },
+    .{ .name = "DOUBL", .shape = &.{} },
+    .{ .name = "BISH_PAIR", .shape = &.{} },
+};
+
+pub const NFEATURES: usize = blk: {
+    var n: usize = 0;
+    for (FIELDS) |f| {
+        var len: usize = 1;
+        for (f.shape) |d| len *= d;
+        n += len;
+    }
+    break :blk n;
+};
+
 pub const Tuner = struct {
     pos_count: u32 = 0,
 
@@ -107,230 +144,233 @@ pub const Tuner = struct {
         };
     }
 
-    pub fn write_header(self: *Tuner, fileOut: fs.File, comptime color: Color) !void {
-        _ = self;
-
-        const c = if (color == Color.White) 0 else 1;
-        const writer = fileOut.writer();
+    // Copies the probe arrays of one color into a flat feature vector laid out as FIELDS
+    pub fn collect_features(self: *Tuner, c: usize, out: *[NFEATURES]u8) void {
+        const probes = .{
+            &self.mat[c],
+            &self.psqt[c],
+            &self.passed_pawn[c],
+            &self.isolated_pawn[c],
+            &self.blocked_passer[c],
+            &self.supported_pawn[c],
+            &self.pawn_phalanx[c],
+            &self.knight_mobility[c],
+            &self.bishop_mobility[c],
+            &self.rook_mobility[c],
+            &self.queen_mobility[c],
+            &self.pawn_attacking[c],
+            &self.knight_attacking[c],
+            &self.bishop_attacking[c],
+            &self.rook_attacking[c],
+            &self.queen_attacking[c],
+            &self.doubled_pawns[c],
+            &self.bishop_pair[c],
+        };
 
-        for (0..NPIECE_TYPES) |p| {
-            try writer.print("MAT_{}_{},", .{ c, p });
+        var i: usize = 0;
+        inline for (probes) |probe| {
+            const bytes = std.mem.asBytes(probe);
+            @memcpy(out[i..][0..bytes.len], bytes);
+            i += bytes.len;
         }
+        std.debug.assert(i == NFEATURES);
+    }
 
-        for (0..NPIECE_TYPES) |p| {
-            for (0..64) |sq| {
-                try writer.print("PSQT_{}_{}_{},", .{ c, p, sq });
-            }
-        }
+    // Converts the lines of in_path that start in the byte range [start, end) into the
+    // feature store out_path. Shard boundaries must be at the start of a line.
+    pub fn convertDataset(self: *Tuner, in_path: []const u8, out_path: []const u8, start: u64, end: ?u64) !void {
+        var file = try std.fs.cwd().openFile(in_path, .{});
+        defer file.close();
 
-        for (0..64) |sq| {
-            try writer.print("PASSED_{}_{},", .{ c, sq });
-        }
+        const stop = end orelse try file.getEndPos();
+        const total = stop -| start;
+        try file.seekTo(start);
 
-        for (0..8) |f| {
-            try writer.print("ISOLATED_{}_{},", .{ c, f });
-        }
+        var buf_reader = std.io.bufferedReader(file.reader());
+        var in_stream = buf_reader.reader();
 
-        for (0..8) |r| {
-            try writer.print("BLOCKED_{}_{},", .{ c, r });
-        }
+        var store = try SparseWriter.create(out_path);
+        defer store.close();
 
-        for (0..8) |r| {
-            try writer.print("SUPPORTED_{}_{},", .{ c, r });
-        }
+        var buf: [1024]u8 = undefined;
+        var done: u64 = 0;
+        var skipped: u64 = 0;
+        var lines: u64 = 0;
+        self.pos_count = 0;
 
-        for (0..8) |r| {
-            try writer.print("PHAL_{}_{},", .{ c, r });
-        }
+        std.debug.print("Starting conversion of {s} [{}, {}) into {s}\n", .{ in_path, start, stop, out_path });
 
-        for (0..9) |r| {
-            try writer.print("KN_MOB_{}_{},", .{ c, r });
-        }
+        while (done < total) {
+            const line = (try in_stream.readUntilDelimiterOrEof(&buf, '\n')) orelse break;
+            done += line.len + 1;
 
-        for (0..14) |r| {
-            try writer.print("BISH_MOB_{}_{},", .{ c, r });
-        }
+            var it = std.mem.splitScalar(u8, line, '[');
+            const fen = std.mem.trim(u8, it.first(), " \r");
+            const result_str = std.mem.trimRight(u8, it.next() orelse "", " \r");
+            if (fen.len == 0) continue;
 
-        for (0..15) |r| {
-            try writer.print("ROOK_MOB_{}_{},", .{ c, r });
-        }
+            // Counted per line read, skipped lines must not repeat a report
+            lines += 1;
+            if (@mod(lines, 10_000) == 0) {
+                std.debug.print("progress {} {} {}\n", .{ @min(done, total), total, self.pos_count });
+            }
 
-        for (0..28) |r| {
-            try writer.print("QN_MOB_{}_{},", .{ c, r });
-        }
+            // Game results give both the result and the target, other labels (e.g. the
+            // search scores of label.py) only the target and result 10. Lines without a
+            // usable label are skipped, a NaN target would spoil the whole training.
+            var results: i8 = 10;
+            var target: f32 = std.math.nan(f32);
+            if (std.mem.eql(u8, result_str, "0.0]")) {
+                results = -1;
+            } else if (std.mem.eql(u8, result_str, "0.5]")) {
+                results = 0;
+            } else if (std.mem.eql(u8, result_str, "1.0]")) {
+                results = 1;
+            } else if (std.fmt.parseFloat(f32, std.mem.trimRight(u8, result_str, "]"))) |label| {
+                target = label;
+            } else |_| {}
+            if (results != 10) {
+                target = @as(f32, @floatFromInt(results + 1)) / 2;
+            }
+            if (!std.math.isFinite(target)) {
+                std.debug.print("Skipping line without a valid label: {s}\n", .{line});
+                skipped += 1;
+                continue;
+            }
 
-        for (0..6) |pt| {
-            try writer.print("P_ATT_{}_{},", .{ c, pt });
-        }
+            var pos = Position.new();
+            self.clear_probe_arrays();
+            try pos.set(fen);
+            _ = pos.eval.clean_eval(&pos, self);
 
-        for (0..6) |pt| {
-            try writer.print("KN_ATT_{}_{},", .{ c, pt });
-        }
+            try store.append(self, fen, results, target, pos.eval.phase);
 
-        for (0..6) |pt| {
-            try writer.print("BISH_ATT_{}_{},", .{ c, pt });
+            self.pos_count += 1;
         }
 
-        for (0..6) |pt| {
-            try writer.print("ROOK_ATT_{}_{},", .{ c, pt });
-        }
+        try store.finish();
 
-        for (0..6) |pt| {
-            try writer.print("QN_ATT_{}_{},", .{ c, pt });
-        }
+        std.debug.print("progress {} {} {}\n", .{ total, total, self.pos_count });
+        std.debug.print("Finished converting {} fen strings, skipped {} lines without a label\n", .{ self.pos_count, skipped });
+    }
+};
 
-        try writer.print("DOUBL_{},", .{c});
+// Sparse feature store written by convertDataset. Every array lives in its own
+// little-endian .bin file so that it can be memory-mapped as is, and schema.json
+// describes the dtypes, shapes and the feature layout. Features of a position are
+// stored as (feature index, count) pairs with zero counts left out; white features
+// use indices [0, NFEATURES) and black features [NFEATURES, 2 * NFEATURES).
+// target is the training label in [0, 1]: the game result or a label read from the EPD.
+pub const SparseWriter = struct {
+    pub const VERSION: u32 = 2;
+
+    pub const Array = enum {
+        row_offsets,
+        feature_index,
+        feature_count,
+        result,
+        target,
+        phase,
+        fen_offsets,
+        fen,
+    };
+
+    const NARRAYS = std.meta.fields(Array).len;
+    const BufferedFileWriter = std.io.BufferedWriter(16 * 1024, fs.File.Writer);
+
+    dir: fs.Dir,
+    files: [NARRAYS]fs.File = undefined,
+    writers: [NARRAYS]BufferedFileWriter = undefined,
+    positions: u64 = 0,
+    entries: u64 = 0,
+    fen_bytes: u64 = 0,
+
+    pub fn create(path: []const u8) !SparseWriter {
+        try fs.cwd().makePath(path);
+
+        var self = SparseWriter{ .dir = try fs.cwd().openDir(path, .{}) };
+        inline for (std.meta.fields(Array), 0..) |f, i| {
+            self.files[i] = try self.dir.createFile(f.name ++ ".bin", .{});
+            self.writers[i] = .{ .unbuffered_writer = self.files[i].writer() };
+        }
+
+        try self.writer(.row_offsets).writeInt(u64, 0, .little);
+        try self.writer(.fen_offsets).writeInt(u64, 0, .little);
+
+        return self;
+    }
 
-        try writer.print("BISH_PAIR_{},", .{c});
+    pub fn close(self: *SparseWriter) void {
+        for (&self.files) |*f| f.close();
+        self.dir.close();
     }
 
-    pub fn write_params(self: *Tuner, fileOut: fs.File, comptime color: Color) !void {
-        const c = if (color == Color.White) 0 else 1;
-        const writer = fileOut.writer();
+    inline fn writer(self: *SparseWriter, comptime array: Array) BufferedFileWriter.Writer {
+        return self.writers[@intFromEnum(array)].writer();
+    }
 
-        for (0..NPIECE_TYPES) |p| {
-            try writer.print("{},", .{self.mat[c][p]});
-        }
+    pub fn append(self: *SparseWriter, tnr: *Tuner, fen: []const u8, result: i8, target: f32, phase: [2]u8) !void {
+        var features: [NFEATURES]u8 = undefined;
 
-        for (0..NPIECE_TYPES) |p| {
-            for (0..64) |sq| {
-                try writer.print("{},", .{self.psqt[c][p][sq]});
+        for (0..2) |c| {
+            tnr.collect_features(c, &features);
+            for (features, 0..) |count, i| {
+                if (count == 0) continue;
+                try self.writer(.feature_index).writeInt(u16, @intCast(c * NFEATURES + i), .little);
+                try self.writer(.feature_count).writeByte(count);
+                self.entries += 1;
             }
         }
 
-        for (0..64) |sq| {
-            try writer.print("{},", .{self.passed_pawn[c][sq]});
-        }
-
-        for (0..8) |f| {
-            try writer.print("{},", .{self.isolated_pawn[c][f]});
-        }
+        try self.writer(.row_offsets).writeInt(u64, self.entries, .little);
+        try self.writer(.result).writeInt(i8, result, .little);
+        try self.writer(.target).writeInt(u32, @bitCast(target), .little);
+        try self.writer(.phase).writeAll(&phase);
 
-        for (0..8) |r| {
-            try writer.print("{},", .{self.blocked_passer[c][r]});
-        }
+        try self.writer(.fen).writeAll(fen);
+        self.fen_bytes += fen.len;
+        try self.writer(.fen_offsets).writeInt(u64, self.fen_bytes, .little);
 
-        for (0..8) |r| {
-            try writer.print("{},", .{self.supported_pawn[c][r]});
-        }
-
-        for (0..8) |r| {
-            try writer.print("{},", .{self.pawn_phalanx[c][r]});
-        }
-
-        for (0..9) |r| {
-            try writer.print("{},", .{self.knight_mobility[c][r]});
-        }
-
-        for (0..14) |r| {
-            try writer.print("{},", .{self.bishop_mobility[c][r]});
-        }
-
-        for (0..15) |r| {
-            try writer.print("{},", .{self.rook_mobility[c][r]});
-        }
-
-        for (0..28) |r| {
-            try writer.print("{},", .{self.queen_mobility[c][r]});
-        }
-
-        for (0..6) |pt| {
-            try writer.print("{},", .{self.pawn_attacking[c][pt]});
-        }
-
-        for (0..6) |pt| {
-            try writer.print("{},", .{self.knight_attacking[c][pt]});
-        }
-
-        for (0..6) |pt| {
-            try writer.print("{},", .{self.bishop_attacking[c][pt]});
-        }
-
-        for (0..6) |pt| {
-            try writer.print("{},", .{self.rook_attacking[c][pt]});
-        }
-
-        for (0..6) |pt| {
-            try writer.print("{},", .{self.queen_attacking[c][pt]});
-        }
-
-        try writer.print("{},", .{self.doubled_pawns[c]});
-
-        try writer.print("{},", .{self.bishop_pair[c]});
+        self.positions += 1;
     }
 
-    pub const NPOS: u32 = 1_428_000;
-    //pub const NPOS: u32 = 9_999_740;
-    //pub const NPOS: u32 = 5_052_234;
+    // Flushes the arrays and writes schema.json, which is what readers use to
+    // decide that the store is complete
+    pub fn finish(self: *SparseWriter) !void {
+        for (&self.writers) |*array_writer| try array_writer.flush();
 
-    pub fn convertDataset(self: *Tuner) !void {
-        var file = try std.fs.cwd().openFile("quiet-labeled.epd", .{});
-        //var file = try std.fs.cwd().openFile("big3.epd", .{});
-        //var file = try std.fs.cwd().openFile("quiet-labeled.epd", .{});
+        var file = try self.dir.createFile("schema.json", .{});
         defer file.close();
 
-        var buf_reader = std.io.bufferedReader(file.reader());
-        var in_stream = buf_reader.reader();
-
-        var fileOut = try fs.cwd().createFile("data.csv", .{ .truncate = false });
-        defer fileOut.close();
-
-        const writer = fileOut.writer();
-
-        var buf: [1024]u8 = undefined;
-        self.pos_count = 0;
-
-        std.debug.print("\nStarting conversion ...\n", .{});
-
-        try writer.print("ID,", .{});
-        try writer.print("FEN,", .{});
-        try writer.print("RESULT,", .{});
-        try writer.print("PHASE_0,PHASE_1,", .{});
+        var bw = std.io.bufferedWriter(file.writer());
+        const w = bw.writer();
 
-        try self.write_header(fileOut, Color.White);
-        //try writer.print(",", .{});
-        try self.write_header(fileOut, Color.Black);
-        try writer.print("\n", .{});
+        try w.print("{{\n  \"format\": \"lambergar-sparse\",\n  \"version\": {},\n", .{VERSION});
+        try w.print("  \"positions\": {},\n  \"entries\": {},\n", .{ self.positions, self.entries });
+        try w.print("  \"colors\": 2,\n  \"features_per_color\": {},\n", .{NFEATURES});
 
-        while (try in_stream.readUntilDelimiterOrEof(&buf, '\n')) |line| {
-            var it = std.mem.splitScalar(u8, line, "[");
-            const fen = it.first();
-            const result_str = it.next();
-
-            if (@mod(self.pos_count, 100) == 0) {
-                std.debug.print("\x1b[1G", .{});
-                std.debug.print("\x1b[1;31mPosition id: {}/{} - {}%", .{ self.pos_count, NPOS, @divTrunc(self.pos_count * 100, NPOS) });
+        try w.print("  \"fields\": [\n", .{});
+        for (FIELDS, 0..) |f, i| {
+            try w.print("    {{\"name\": \"{s}\", \"shape\": [", .{f.name});
+            for (f.shape, 0..) |d, j| {
+                try w.print("{s}{}", .{ if (j == 0) "" else ", ", d });
             }
-
-            var results: i8 = 10;
-            if (std.mem.eql(u8, result_str orelse "", "0.0]")) {
-                results = -1;
-            } else if (std.mem.eql(u8, result_str orelse "", "0.5]")) {
-                results = 0;
-            } else if (std.mem.eql(u8, result_str orelse "", "1.0]")) {
-                results = 1;
-            } else {
-                std.debug.print("String does not match any known patterns.\n\n", .{});
-            }
-
-            var pos = Position.new();
-            self.clear_probe_arrays();
-            try pos.set(fen);
-            _ = pos.eval.clean_eval(&pos, self);
-
-            try writer.print("{},", .{self.pos_count});
-            try writer.print("{s},", .{fen});
-            try writer.print("{},", .{results});
-            try writer.print("{},{},", .{ pos.eval.phase[0], pos.eval.phase[1] });
-
-            try self.write_params(fileOut, Color.White);
-            //try writer.print(",", .{});
-            try self.write_params(fileOut, Color.Black);
-            try writer.print("\n", .{});
-
-            self.pos_count += 1;
-        }
-
-        std.debug.print("\n\x1b[0mFinished converting {} fen strings\n", .{self.pos_count});
+            try w.print("]}}{s}\n", .{if (i + 1 < FIELDS.len) "," else ""});
+        }
+        try w.print("  ],\n", .{});
+
+        const n = self.positions;
+        try w.print("  \"arrays\": {{\n", .{});
+        try w.print("    \"row_offsets\": {{\"file\": \"row_offsets.bin\", \"dtype\": \"<u8\", \"shape\": [{}]}},\n", .{n + 1});
+        try w.print("    \"feature_index\": {{\"file\": \"feature_index.bin\", \"dtype\": \"<u2\", \"shape\": [{}]}},\n", .{self.entries});
+        try w.print("    \"feature_count\": {{\"file\": \"feature_count.bin\", \"dtype\": \"u1\", \"shape\": [{}]}},\n", .{self.entries});
+        try w.print("    \"result\": {{\"file\": \"result.bin\", \"dtype\": \"i1\", \"shape\": [{}]}},\n", .{n});
+        try w.print("    \"target\": {{\"file\": \"target.bin\", \"dtype\": \"<f4\", \"shape\": [{}]}},\n", .{n});
+        try w.print("    \"phase\": {{\"file\": \"phase.bin\", \"dtype\": \"u1\", \"shape\": [{}, 2]}},\n", .{n});
+        try w.print("    \"fen_offsets\": {{\"file\": \"fen_offsets.bin\", \"dtype\": \"<u8\", \"shape\": [{}]}},\n", .{n + 1});
+        try w.print("    \"fen\": {{\"file\": \"fen.bin\", \"dtype\": \"u1\", \"shape\": [{}]}}\n", .{self.fen_bytes});
+        try w.print("  }}\n}}\n", .{});
+
+        try bw.flush();
     }
 };
@@ -30,6 +30,26 @@ const HASH_SIZE_MAX = 4096;
 pub const empty_board = "8/8/8/8/8/8/8/8 w - - ";
 pub const start_position = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 ";
 
+pub const BENCH_DEPTH = 12;
+
+// Positions searched by the bench command
+const bench_positions = [_][]const u8{
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3",
+    "rnbqkb1r/pp1p1ppp/4pn2/2p5/2PP4/5N2/PP2PPPP/RNBQKB1R w KQkq - 0 4",
+    "r3k2r/2pb1ppp/2pp1q2/p7/1nP1B3/1P2P3/P2N1PPP/R2QK2R w KQkq a6 0 14",
+    "4rrk1/2p1b1p1/p1p3q1/4p3/2P2n1p/1P1NR2P/PB3PP1/3R1QK1 b - - 2 24",
+    "r3qbrk/6p1/2b2pPp/p3pP1Q/PpPpP2P/3P1B2/2PB3K/R5R1 w - - 16 42",
+    "6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1",
+    "8/8/1p6/8/2P5/1K6/8/7k w - - 0 1",
+    "8/3k4/8/8/3PK3/8/8/8 w - - 0 1",
+};
+
 pub var debug = false;
 
 pub const MAX_THREADS = 32;
@@ -93,7 +113,7 @@ pub fn init_all() void {
     search.init_lmr();
 }
 
-pub fn uci_loop(allocator: std.mem.Allocator) !void {
+fn init_engine() !void {
     init_all();
 
     if (nnue.engine_using_nnue) {
@@ -106,7 +126,6 @@ pub fn uci_loop(allocator: std.mem.Allocator) !void {
     }
 
     try tt.TT.init(128 + 1);
-    defer tt.TT.deinit();
 
     for (0..MAX_THREADS) |i| {
         pos[i] = Position.new();
@@ -114,6 +133,58 @@ pub fn uci_loop(allocator: std.mem.Allocator) !void {
         thinkers[i] = Search.new();
         thinkers[i].clear_for_new_game();
     }
+}
+
+// Searches every bench position to a fixed depth with one thread and a cleared
+// search state, so the node count only changes when the search changes
+pub fn bench(depth: u32) !void {
+    const stdout = std.io.getStdOut().writer();
+    const saved_threads = num_threads;
+    num_threads = 1;
+    defer num_threads = saved_threads;
+
+    var total_nodes: u64 = 0;
+    var timer = try std.time.Timer.start();
+
+    for (bench_positions, 0..) |fen, i| {
+        _ = try std.fmt.format(stdout, "\nPosition: {}/{} {s}\n", .{ i + 1, bench_positions.len, fen });
+
+        thinkers[0].clear_for_new_game();
+        tt.TT.clear();
+        try pos[0].set(fen);
+
+        thinkers[0].max_depth = depth;
+        thinkers[0].manager.termination = search.Termination.DEPTH;
+        thinkers[0].manager.set_time_limits(null, null, null, null);
+        search.start_main_search(&thinkers[0], &pos[0]);
+        total_nodes += thinkers[0].nodes;
+    }
+
+    const elapsed_ms = @max(timer.read() / std.time.ns_per_ms, 1);
+
+    // Leave the engine as after ucinewgame
+    thinkers[0].clear_for_new_game();
+    thinkers[0].manager.termination = search.Termination.INFINITE;
+    tt.TT.clear();
+    try pos[0].set(start_position);
+
+    _ = try std.fmt.format(stdout, "\n===========================\n", .{});
+    _ = try std.fmt.format(stdout, "Total time (ms) : {}\n", .{elapsed_ms});
+    _ = try std.fmt.format(stdout, "Nodes searched  : {}\n", .{total_nodes});
+    _ = try std.fmt.format(stdout, "Nodes/second    : {}\n", .{total_nodes * 1000 / elapsed_ms});
+}
+
+// lambergar bench [depth]
+pub fn run_bench(depth: u32) !void {
+    try init_engine();
+    defer tt.TT.deinit();
+
+    try bench(depth);
+}
+
+pub fn uci_loop(allocator: std.mem.Allocator) !void {
+    try init_engine();
+    defer tt.TT.deinit();
 
     var main_search_thread: ?std.Thread = null;
 
@@ -394,6 +465,14 @@ pub fn uci_loop(allocator: std.mem.Allocator) !void {
             } else {
                 _ = try std.fmt.format(stdout, "{d:.3}MN/s\n", .{nps / 1_000_000});
             }
+        } else if (std.mem.eql(u8, command, "bench")) {
+            if (main_search_thread != null) {
+                @atomicStore(bool, &thinkers[0].stop, true, .seq_cst);
+                main_search_thread.?.join();
+                main_search_thread = null;
+            }
+            const depth = u32_from_str(words.next() orelse "0");
+            try bench(if (depth == 0) BENCH_DEPTH else depth);
         } else if (std.mem.eql(u8, command, "seepos")) {
             var list: MoveList = .{};
 
@@ -0,0 +1,114 @@
+import argparse
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from feature_store import merge_stores
+
+# Parallel dataset conversion. The EPD file is cut into shards at line starts, every
+# shard is converted by its own engine process (compiled in tuner mode, see
+# README) and the shard stores are merged in file order, so position IDs are the
+# same as with a single-threaded conversion.
+
+DEFAULT_ENGINE = os.path.join('..', 'zig-out', 'bin', 'lambergar.exe' if os.name == 'nt' else 'lambergar')
+
+
+def shard_boundaries(path, n_shards):
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as file:
+        for i in range(1, n_shards):
+            file.seek(size * i // n_shards)
+            if file.tell() > 0:
+                # Move to the start of the next line
+                file.seek(file.tell() - 1)
+                file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return sorted(set(boundaries))
+
+
+def has_positions(path):
+    # Stops at the first non-blank line, so only empty or blank files are read to the end
+    with open(path, 'rb') as file:
+        return any(line.strip() for line in file)
+
+
+class Progress:
+    def __init__(self, n_shards):
+        self.lock = threading.Lock()
+        self.n_shards = n_shards
+        self.start = time.time()
+        self.reported = {}
+
+    def update(self, shard, done, total, positions):
+        percent = 100 * done // max(total, 1)
+        with self.lock:
+            # One line per shard every 10 %
+            if percent // 10 == self.reported.get(shard, -1):
+                return
+            self.reported[shard] = percent // 10
+            print(f"shard {shard + 1}/{self.n_shards}: {percent}% ({positions} positions, {time.time() - self.start:.0f}s)", flush=True)
+
+
+def convert_shard(engine, in_path, out_path, start, end, shard, progress):
+    process = subprocess.Popen(
+        [engine, in_path, out_path, str(start), str(end)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    # Only the last lines are reported, an unlabelled file gives one warning per line
+    positions, errors = 0, deque(maxlen=10)
+    for line in process.stderr:
+        words = line.split()
+        if len(words) == 4 and words[0] == 'progress':
+            done, total, positions = map(int, words[1:])
+            progress.update(shard, done, total, positions)
+        elif words and not line.startswith('Starting') and not line.startswith('Finished'):
+            errors.append(line.rstrip())
+
+    if process.wait() != 0:
+        raise RuntimeError(f"Shard {shard + 1} [{start}, {end}) failed with exit code {process.returncode}: " + '\n'.join(errors))
+    return positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert an EPD file into a feature store using several engine processes.')
+    parser.add_argument('input', type=str, nargs='?', default='quiet-labeled.epd', help='EPD file with positions and results')
+    parser.add_argument('output', type=str, nargs='?', default='data', help='Feature store directory to write')
+    parser.add_argument('--engine', type=str, default=DEFAULT_ENGINE, help='Engine compiled in tuner mode')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Number of converter processes')
+    parser.add_argument('--shards', type=int, default=None, help='Number of shards (default: 4 per job)')
+    parser.add_argument('--keep-shards', action='store_true', help='Keep the shard stores after merging')
+    args = parser.parse_args()
+
+    if not has_positions(args.input):
+        raise SystemExit(f"{args.input} contains no positions")
+
+    n_shards = args.shards or 4 * args.jobs
+    boundaries = shard_boundaries(args.input, n_shards)
+    ranges = list(zip(boundaries[:-1], boundaries[1:]))
+    shard_dir = args.output + '.shards'
+    shard_paths = [os.path.join(shard_dir, f'shard_{i:04d}') for i in range(len(ranges))]
+    print(f"Converting {args.input} in {len(ranges)} shards with {args.jobs} processes")
+
+    start = time.time()
+    progress = Progress(len(ranges))
+    # Threads only wait on the converter processes, which do the actual work
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(convert_shard, args.engine, args.input, path, lo, hi, i, progress)
+                   for i, (path, (lo, hi)) in enumerate(zip(shard_paths, ranges))]
+        positions = sum(future.result() for future in futures)
+    print(f"Converted {positions} positions in {time.time() - start:.1f}s, merging ...")
+
+    store = merge_stores(shard_paths, args.output)
+    if not args.keep_shards:
+        shutil.rmtree(shard_dir)
+    print(f"Wrote {len(store)} positions to {args.output} in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
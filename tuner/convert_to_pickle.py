@@ -1,25 +0,0 @@
-import pandas as pd 
-import pickle
-import os
-
-in_path = 'data.csv' #Path where the large file is
-out_path = 'param_chunks' #Path to save the pickle files to
-chunk_size = 500000 #size of chunks relies on your available memory
-
-# Regex replace ([A-Z_]+\d+_\d+),? with '$1': 'uint8',
-
-df_dtype = {
-'ID': 'uint32', 'FEN': 'str', 'RESULT': 'int8', 'PHASE_0': 'uint8', 'PHASE_1': 'uint8', 'MAT_0_0': 'uint8', 'MAT_0_1': 'uint8', 'MAT_0_2': 'uint8', 'MAT_0_3': 'uint8', 'MAT_0_4': 'uint8', 'MAT_0_5': 'uint8', 'PSQT_0_0_0': 'uint8', 'PSQT_0_0_1': 'uint8', 'PSQT_0_0_2': 'uint8', 'PSQT_0_0_3': 'uint8', 'PSQT_0_0_4': 'uint8', 'PSQT_0_0_5': 'uint8', 'PSQT_0_0_6': 'uint8', 'PSQT_0_0_7': 'uint8', 'PSQT_0_0_8': 'uint8', 'PSQT_0_0_9': 'uint8', 'PSQT_0_0_10': 'uint8', 'PSQT_0_0_11': 'uint8', 'PSQT_0_0_12': 'uint8', 'PSQT_0_0_13': 'uint8', 'PSQT_0_0_14': 'uint8', 'PSQT_0_0_15': 'uint8', 'PSQT_0_0_16': 'uint8', 'PSQT_0_0_17': 'uint8', 'PSQT_0_0_18': 'uint8', 'PSQT_0_0_19': 'uint8', 'PSQT_0_0_20': 'uint8', 'PSQT_0_0_21': 'uint8', 'PSQT_0_0_22': 'uint8', 'PSQT_0_0_23': 'uint8', 'PSQT_0_0_24': 'uint8', 'PSQT_0_0_25': 'uint8', 'PSQT_0_0_26': 'uint8', 'PSQT_0_0_27': 'uint8', 'PSQT_0_0_28': 'uint8', 'PSQT_0_0_29': 'uint8', 'PSQT_0_0_30': 'uint8', 'PSQT_0_0_31': 'uint8', 'PSQT_0_0_32': 'uint8', 'PSQT_0_0_33': 'uint8', 'PSQT_0_0_34': 'uint8', 'PSQT_0_0_35': 'uint8', 'PSQT_0_0_36': 'uint8', 'PSQT_0_0_37': 'uint8', 'PSQT_0_0_38': 'uint8', 'PSQT_0_0_39': 'uint8', 'PSQT_0_0_40': 'uint8', 'PSQT_0_0_41': 'uint8', 'PSQT_0_0_42': 'uint8', 'PSQT_0_0_43': 'uint8', 'PSQT_0_0_44': 'uint8', 'PSQT_0_0_45': 'uint8', 'PSQT_0_0_46': 'uint8', 'PSQT_0_0_47': 'uint8', 'PSQT_0_0_48': 'uint8', 'PSQT_0_0_49': 'uint8', 'PSQT_0_0_50': 'uint8', 'PSQT_0_0_51': 'uint8', 'PSQT_0_0_52': 'uint8', 'PSQT_0_0_53': 'uint8', 'PSQT_0_0_54': 'uint8', 'PSQT_0_0_55': 'uint8', 'PSQT_0_0_56': 'uint8', 'PSQT_0_0_57': 'uint8', 'PSQT_0_0_58': 'uint8', 'PSQT_0_0_59': 'uint8', 'PSQT_0_0_60': 'uint8', 'PSQT_0_0_61': 'uint8', 'PSQT_0_0_62': 'uint8', 'PSQT_0_0_63': 'uint8', 'PSQT_0_1_0': 'uint8', 'PSQT_0_1_1': 'uint8', 'PSQT_0_1_2': 'uint8', 'PSQT_0_1_3': 'uint8', 'PSQT_0_1_4': 'uint8', 'PSQT_0_1_5': 'uint8', 'PSQT_0_1_6': 'uint8', 'PSQT_0_1_7': 'uint8', 'PSQT_0_1_8': 'uint8', 'PSQT_0_1_9': 'uint8', 'PSQT_0_1_10': 'uint8', 'PSQT_0_1_11': 'uint8', 'PSQT_0_1_12': 'uint8', 'PSQT_0_1_13': 'uint8', 'PSQT_0_1_14': 'uint8', 'PSQT_0_1_15': 'uint8', 'PSQT_0_1_16': 'uint8', 'PSQT_0_1_17': 'uint8', 'PSQT_0_1_18': 'uint8', 'PSQT_0_1_19': 'uint8', 'PSQT_0_1_20': 'uint8', 'PSQT_0_1_21': 'uint8', 'PSQT_0_1_22': 'uint8', 'PSQT_0_1_23': 'uint8', 'PSQT_0_1_24': 'uint8', 'PSQT_0_1_25': 'uint8', 'PSQT_0_1_26': 'uint8', 'PSQT_0_1_27': 'uint8', 'PSQT_0_1_28': 'uint8', 'PSQT_0_1_29': 'uint8', 'PSQT_0_1_30': 'uint8', 'PSQT_0_1_31': 'uint8', 'PSQT_0_1_32': 'uint8', 'PSQT_0_1_33': 'uint8', 'PSQT_0_1_34': 'uint8', 'PSQT_0_1_35': 'uint8', 'PSQT_0_1_36': 'uint8', 'PSQT_0_1_37': 'uint8', 'PSQT_0_1_38': 'uint8', 'PSQT_0_1_39': 'uint8', 'PSQT_0_1_40': 'uint8', 'PSQT_0_1_41': 'uint8', 'PSQT_0_1_42': 'uint8', 'PSQT_0_1_43': 'uint8', 'PSQT_0_1_44': 'uint8', 'PSQT_0_1_45': 'uint8', 'PSQT_0_1_46': 'uint8', 'PSQT_0_1_47': 'uint8', 'PSQT_0_1_48': 'uint8', 'PSQT_0_1_49': 'uint8', 'PSQT_0_1_50': 'uint8', 'PSQT_0_1_51': 'uint8', 'PSQT_0_1_52': 'uint8', 'PSQT_0_1_53': 'uint8', 'PSQT_0_1_54': 'uint8', 'PSQT_0_1_55': 'uint8', 'PSQT_0_1_56': 'uint8', 'PSQT_0_1_57': 'uint8', 'PSQT_0_1_58': 'uint8', 'PSQT_0_1_59': 'uint8', 'PSQT_0_1_60': 'uint8', 'PSQT_0_1_61': 'uint8', 'PSQT_0_1_62': 'uint8', 'PSQT_0_1_63': 'uint8', 'PSQT_0_2_0': 'uint8', 'PSQT_0_2_1': 'uint8', 'PSQT_0_2_2': 'uint8', 'PSQT_0_2_3': 'uint8', 'PSQT_0_2_4': 'uint8', 'PSQT_0_2_5': 'uint8', 'PSQT_0_2_6': 'uint8', 'PSQT_0_2_7': 'uint8', 'PSQT_0_2_8': 'uint8', 'PSQT_0_2_9': 'uint8', 'PSQT_0_2_10': 'uint8', 'PSQT_0_2_11': 'uint8', 'PSQT_0_2_12': 'uint8', 'PSQT_0_2_13': 'uint8', 'PSQT_0_2_14': 'uint8', 'PSQT_0_2_15': 'uint8', 'PSQT_0_2_16': 'uint8', 'PSQT_0_2_17': 'uint8', 'PSQT_0_2_18': 'uint8', 'PSQT_0_2_19': 'uint8', 'PSQT_0_2_20': 'uint8', 'PSQT_0_2_21': 'uint8', 'PSQT_0_2_22': 'uint8', 'PSQT_0_2_23': 'uint8', 'PSQT_0_2_24': 'uint8', 'PSQT_0_2_25': 'uint8', 'PSQT_0_2_26': 'uint8', 'PSQT_0_2_27': 'uint8', 'PSQT_0_2_28': 'uint8', 'PSQT_0_2_29': 'uint8', 'PSQT_0_2_30': 'uint8', 'PSQT_0_2_31': 'uint8', 'PSQT_0_2_32': 'uint8', 'PSQT_0_2_33': 'uint8', 'PSQT_0_2_34': 'uint8', 'PSQT_0_2_35': 'uint8', 'PSQT_0_2_36': 'uint8', 'PSQT_0_2_37': 'uint8', 'PSQT_0_2_38': 'uint8', 'PSQT_0_2_39': 'uint8', 'PSQT_0_2_40': 'uint8', 'PSQT_0_2_41': 'uint8', 'PSQT_0_2_42': 'uint8', 'PSQT_0_2_43': 'uint8', 'PSQT_0_2_44': 'uint8', 'PSQT_0_2_45': 'uint8', 'PSQT_0_2_46': 'uint8', 'PSQT_0_2_47': 'uint8', 'PSQT_0_2_48': 'uint8', 'PSQT_0_2_49': 'uint8', 'PSQT_0_2_50': 'uint8', 'PSQT_0_2_51': 'uint8', 'PSQT_0_2_52': 'uint8', 'PSQT_0_2_53': 'uint8', 'PSQT_0_2_54': 'uint8', 'PSQT_0_2_55': 'uint8', 'PSQT_0_2_56': 'uint8', 'PSQT_0_2_57': 'uint8', 'PSQT_0_2_58': 'uint8', 'PSQT_0_2_59': 'uint8', 'PSQT_0_2_60': 'uint8', 'PSQT_0_2_61': 'uint8', 'PSQT_0_2_62': 'uint8', 'PSQT_0_2_63': 'uint8', 'PSQT_0_3_0': 'uint8', 'PSQT_0_3_1': 'uint8', 'PSQT_0_3_2': 'uint8', 'PSQT_0_3_3': 'uint8', 'PSQT_0_3_4': 'uint8', 'PSQT_0_3_5': 'uint8', 'PSQT_0_3_6': 'uint8', 'PSQT_0_3_7': 'uint8', 'PSQT_0_3_8': 'uint8', 'PSQT_0_3_9': 'uint8', 'PSQT_0_3_10': 'uint8', 'PSQT_0_3_11': 'uint8', 'PSQT_0_3_12': 'uint8', 'PSQT_0_3_13': 'uint8', 'PSQT_0_3_14': 'uint8', 'PSQT_0_3_15': 'uint8', 'PSQT_0_3_16': 'uint8', 'PSQT_0_3_17': 'uint8', 'PSQT_0_3_18': 'uint8', 'PSQT_0_3_19': 'uint8', 'PSQT_0_3_20': 'uint8', 'PSQT_0_3_21': 'uint8', 'PSQT_0_3_22': 'uint8', 'PSQT_0_3_23': 'uint8', 'PSQT_0_3_24': 'uint8', 'PSQT_0_3_25': 'uint8', 'PSQT_0_3_26': 'uint8', 'PSQT_0_3_27': 'uint8', 'PSQT_0_3_28': 'uint8', 'PSQT_0_3_29': 'uint8', 'PSQT_0_3_30': 'uint8', 'PSQT_0_3_31': 'uint8', 'PSQT_0_3_32': 'uint8', 'PSQT_0_3_33': 'uint8', 'PSQT_0_3_34': 'uint8', 'PSQT_0_3_35': 'uint8', 'PSQT_0_3_36': 'uint8', 'PSQT_0_3_37': 'uint8', 'PSQT_0_3_38': 'uint8', 'PSQT_0_3_39': 'uint8', 'PSQT_0_3_40': 'uint8', 'PSQT_0_3_41': 'uint8', 'PSQT_0_3_42': 'uint8', 'PSQT_0_3_43': 'uint8', 'PSQT_0_3_44': 'uint8', 'PSQT_0_3_45': 'uint8', 'PSQT_0_3_46': 'uint8', 'PSQT_0_3_47': 'uint8', 'PSQT_0_3_48': 'uint8', 'PSQT_0_3_49': 'uint8', 'PSQT_0_3_50': 'uint8', 'PSQT_0_3_51': 'uint8', 'PSQT_0_3_52': 'uint8', 'PSQT_0_3_53': 'uint8', 'PSQT_0_3_54': 'uint8', 'PSQT_0_3_55': 'uint8', 'PSQT_0_3_56': 'uint8', 'PSQT_0_3_57': 'uint8', 'PSQT_0_3_58': 'uint8', 'PSQT_0_3_59': 'uint8', 'PSQT_0_3_60': 'uint8', 'PSQT_0_3_61': 'uint8', 'PSQT_0_3_62': 'uint8', 'PSQT_0_3_63': 'uint8', 'PSQT_0_4_0': 'uint8', 'PSQT_0_4_1': 'uint8', 'PSQT_0_4_2': 'uint8', 'PSQT_0_4_3': 'uint8', 'PSQT_0_4_4': 'uint8', 'PSQT_0_4_5': 'uint8', 'PSQT_0_4_6': 'uint8', 'PSQT_0_4_7': 'uint8', 'PSQT_0_4_8': 'uint8', 'PSQT_0_4_9': 'uint8', 'PSQT_0_4_10': 'uint8', 'PSQT_0_4_11': 'uint8', 'PSQT_0_4_12': 'uint8', 'PSQT_0_4_13': 'uint8', 'PSQT_0_4_14': 'uint8', 'PSQT_0_4_15': 'uint8', 'PSQT_0_4_16': 'uint8', 'PSQT_0_4_17': 'uint8', 'PSQT_0_4_18': 'uint8', 'PSQT_0_4_19': 'uint8', 'PSQT_0_4_20': 'uint8', 'PSQT_0_4_21': 'uint8', 'PSQT_0_4_22': 'uint8', 'PSQT_0_4_23': 'uint8', 'PSQT_0_4_24': 'uint8', 'PSQT_0_4_25': 'uint8', 'PSQT_0_4_26': 'uint8', 'PSQT_0_4_27': 'uint8', 'PSQT_0_4_28': 'uint8', 'PSQT_0_4_29': 'uint8', 'PSQT_0_4_30': 'uint8', 'PSQT_0_4_31': 'uint8', 'PSQT_0_4_32': 'uint8', 'PSQT_0_4_33': 'uint8', 'PSQT_0_4_34': 'uint8', 'PSQT_0_4_35': 'uint8', 'PSQT_0_4_36': 'uint8', 'PSQT_0_4_37': 'uint8', 'PSQT_0_4_38': 'uint8', 'PSQT_0_4_39': 'uint8', 'PSQT_0_4_40': 'uint8', 'PSQT_0_4_41': 'uint8', 'PSQT_0_4_42': 'uint8', 'PSQT_0_4_43': 'uint8', 'PSQT_0_4_44': 'uint8', 'PSQT_0_4_45': 'uint8', 'PSQT_0_4_46': 'uint8', 'PSQT_0_4_47': 'uint8', 'PSQT_0_4_48': 'uint8', 'PSQT_0_4_49': 'uint8', 'PSQT_0_4_50': 'uint8', 'PSQT_0_4_51': 'uint8', 'PSQT_0_4_52': 'uint8', 'PSQT_0_4_53': 'uint8', 'PSQT_0_4_54': 'uint8', 'PSQT_0_4_55': 'uint8', 'PSQT_0_4_56': 'uint8', 'PSQT_0_4_57': 'uint8', 'PSQT_0_4_58': 'uint8', 'PSQT_0_4_59': 'uint8', 'PSQT_0_4_60': 'uint8', 'PSQT_0_4_61': 'uint8', 'PSQT_0_4_62': 'uint8', 'PSQT_0_4_63': 'uint8', 'PSQT_0_5_0': 'uint8', 'PSQT_0_5_1': 'uint8', 'PSQT_0_5_2': 'uint8', 'PSQT_0_5_3': 'uint8', 'PSQT_0_5_4': 'uint8', 'PSQT_0_5_5': 'uint8', 'PSQT_0_5_6': 'uint8', 'PSQT_0_5_7': 'uint8', 'PSQT_0_5_8': 'uint8', 'PSQT_0_5_9': 'uint8', 'PSQT_0_5_10': 'uint8', 'PSQT_0_5_11': 'uint8', 'PSQT_0_5_12': 'uint8', 'PSQT_0_5_13': 'uint8', 'PSQT_0_5_14': 'uint8', 'PSQT_0_5_15': 'uint8', 'PSQT_0_5_16': 'uint8', 'PSQT_0_5_17': 'uint8', 'PSQT_0_5_18': 'uint8', 'PSQT_0_5_19': 'uint8', 'PSQT_0_5_20': 'uint8', 'PSQT_0_5_21': 'uint8', 'PSQT_0_5_22': 'uint8', 'PSQT_0_5_23': 'uint8', 'PSQT_0_5_24': 'uint8', 'PSQT_0_5_25': 'uint8', 'PSQT_0_5_26': 'uint8', 'PSQT_0_5_27': 'uint8', 'PSQT_0_5_28': 'uint8', 'PSQT_0_5_29': 'uint8', 'PSQT_0_5_30': 'uint8', 'PSQT_0_5_31': 'uint8', 'PSQT_0_5_32': 'uint8', 'PSQT_0_5_33': 'uint8', 'PSQT_0_5_34': 'uint8', 'PSQT_0_5_35': 'uint8', 'PSQT_0_5_36': 'uint8', 'PSQT_0_5_37': 'uint8', 'PSQT_0_5_38': 'uint8', 'PSQT_0_5_39': 'uint8', 'PSQT_0_5_40': 'uint8', 'PSQT_0_5_41': 'uint8', 'PSQT_0_5_42': 'uint8', 'PSQT_0_5_43': 'uint8', 'PSQT_0_5_44': 'uint8', 'PSQT_0_5_45': 'uint8', 'PSQT_0_5_46': 'uint8', 'PSQT_0_5_47': 'uint8', 'PSQT_0_5_48': 'uint8', 'PSQT_0_5_49': 'uint8', 'PSQT_0_5_50': 'uint8', 'PSQT_0_5_51': 'uint8', 'PSQT_0_5_52': 'uint8', 'PSQT_0_5_53': 'uint8', 'PSQT_0_5_54': 'uint8', 'PSQT_0_5_55': 'uint8', 'PSQT_0_5_56': 'uint8', 'PSQT_0_5_57': 'uint8', 'PSQT_0_5_58': 'uint8', 'PSQT_0_5_59': 'uint8', 'PSQT_0_5_60': 'uint8', 'PSQT_0_5_61': 'uint8', 'PSQT_0_5_62': 'uint8', 'PSQT_0_5_63': 'uint8', 'PASSED_0_0': 'uint8', 'PASSED_0_1': 'uint8', 'PASSED_0_2': 'uint8', 'PASSED_0_3': 'uint8', 'PASSED_0_4': 'uint8', 'PASSED_0_5': 'uint8', 'PASSED_0_6': 'uint8', 'PASSED_0_7': 'uint8', 'PASSED_0_8': 'uint8', 'PASSED_0_9': 'uint8', 'PASSED_0_10': 'uint8', 'PASSED_0_11': 'uint8', 'PASSED_0_12': 'uint8', 'PASSED_0_13': 'uint8', 'PASSED_0_14': 'uint8', 'PASSED_0_15': 'uint8', 'PASSED_0_16': 'uint8', 'PASSED_0_17': 'uint8', 'PASSED_0_18': 'uint8', 'PASSED_0_19': 'uint8', 'PASSED_0_20': 'uint8', 'PASSED_0_21': 'uint8', 'PASSED_0_22': 'uint8', 'PASSED_0_23': 'uint8', 'PASSED_0_24': 'uint8', 'PASSED_0_25': 'uint8', 'PASSED_0_26': 'uint8', 'PASSED_0_27': 'uint8', 'PASSED_0_28': 'uint8', 'PASSED_0_29': 'uint8', 'PASSED_0_30': 'uint8', 'PASSED_0_31': 'uint8', 'PASSED_0_32': 'uint8', 'PASSED_0_33': 'uint8', 'PASSED_0_34': 'uint8', 'PASSED_0_35': 'uint8', 'PASSED_0_36': 'uint8', 'PASSED_0_37': 'uint8', 'PASSED_0_38': 'uint8', 'PASSED_0_39': 'uint8', 'PASSED_0_40': 'uint8', 'PASSED_0_41': 'uint8', 'PASSED_0_42': 'uint8', 'PASSED_0_43': 'uint8', 'PASSED_0_44': 'uint8', 'PASSED_0_45': 'uint8', 'PASSED_0_46': 'uint8', 'PASSED_0_47': 'uint8', 'PASSED_0_48': 'uint8', 'PASSED_0_49': 'uint8', 'PASSED_0_50': 'uint8', 'PASSED_0_51': 'uint8', 'PASSED_0_52': 'uint8', 'PASSED_0_53': 'uint8', 'PASSED_0_54': 'uint8', 'PASSED_0_55': 'uint8', 'PASSED_0_56': 'uint8', 'PASSED_0_57': 'uint8', 'PASSED_0_58': 'uint8', 'PASSED_0_59': 'uint8', 'PASSED_0_60': 'uint8', 'PASSED_0_61': 'uint8', 'PASSED_0_62': 'uint8', 'PASSED_0_63': 'uint8', 'ISOLATED_0_0': 'uint8', 'ISOLATED_0_1': 'uint8', 'ISOLATED_0_2': 'uint8', 'ISOLATED_0_3': 'uint8', 'ISOLATED_0_4': 'uint8', 'ISOLATED_0_5': 'uint8', 'ISOLATED_0_6': 'uint8', 'ISOLATED_0_7': 'uint8', 'BLOCKED_0_0': 'uint8', 'BLOCKED_0_1': 'uint8', 'BLOCKED_0_2': 'uint8', 'BLOCKED_0_3': 'uint8', 'BLOCKED_0_4': 'uint8', 'BLOCKED_0_5': 'uint8', 'BLOCKED_0_6': 'uint8', 'BLOCKED_0_7': 'uint8', 'SUPPORTED_0_0': 'uint8', 'SUPPORTED_0_1': 'uint8', 'SUPPORTED_0_2': 'uint8', 'SUPPORTED_0_3': 'uint8', 'SUPPORTED_0_4': 'uint8', 'SUPPORTED_0_5': 'uint8', 'SUPPORTED_0_6': 'uint8', 'SUPPORTED_0_7': 'uint8', 'PHAL_0_0': 'uint8', 'PHAL_0_1': 'uint8', 'PHAL_0_2': 'uint8', 'PHAL_0_3': 'uint8', 'PHAL_0_4': 'uint8', 'PHAL_0_5': 'uint8', 'PHAL_0_6': 'uint8', 'PHAL_0_7': 'uint8', 'KN_MOB_0_0': 'uint8', 'KN_MOB_0_1': 'uint8', 'KN_MOB_0_2': 'uint8', 'KN_MOB_0_3': 'uint8', 'KN_MOB_0_4': 'uint8', 'KN_MOB_0_5': 'uint8', 'KN_MOB_0_6': 'uint8', 'KN_MOB_0_7': 'uint8', 'KN_MOB_0_8': 'uint8', 'BISH_MOB_0_0': 'uint8', 'BISH_MOB_0_1': 'uint8', 'BISH_MOB_0_2': 'uint8', 'BISH_MOB_0_3': 'uint8', 'BISH_MOB_0_4': 'uint8', 'BISH_MOB_0_5': 'uint8', 'BISH_MOB_0_6': 'uint8', 'BISH_MOB_0_7': 'uint8', 'BISH_MOB_0_8': 'uint8', 'BISH_MOB_0_9': 'uint8', 'BISH_MOB_0_10': 'uint8', 'BISH_MOB_0_11': 'uint8', 'BISH_MOB_0_12': 'uint8', 'BISH_MOB_0_13': 'uint8', 'ROOK_MOB_0_0': 'uint8', 'ROOK_MOB_0_1': 'uint8', 'ROOK_MOB_0_2': 'uint8', 'ROOK_MOB_0_3': 'uint8', 'ROOK_MOB_0_4': 'uint8', 'ROOK_MOB_0_5': 'uint8', 'ROOK_MOB_0_6': 'uint8', 'ROOK_MOB_0_7': 'uint8', 'ROOK_MOB_0_8': 'uint8', 'ROOK_MOB_0_9': 'uint8', 'ROOK_MOB_0_10': 'uint8', 'ROOK_MOB_0_11': 'uint8', 'ROOK_MOB_0_12': 'uint8', 'ROOK_MOB_0_13': 'uint8', 'ROOK_MOB_0_14': 'uint8', 'QN_MOB_0_0': 'uint8', 'QN_MOB_0_1': 'uint8', 'QN_MOB_0_2': 'uint8', 'QN_MOB_0_3': 'uint8', 'QN_MOB_0_4': 'uint8', 'QN_MOB_0_5': 'uint8', 'QN_MOB_0_6': 'uint8', 'QN_MOB_0_7': 'uint8', 'QN_MOB_0_8': 'uint8', 'QN_MOB_0_9': 'uint8', 'QN_MOB_0_10': 'uint8', 'QN_MOB_0_11': 'uint8', 'QN_MOB_0_12': 'uint8', 'QN_MOB_0_13': 'uint8', 'QN_MOB_0_14': 'uint8', 'QN_MOB_0_15': 'uint8', 'QN_MOB_0_16': 'uint8', 'QN_MOB_0_17': 'uint8', 'QN_MOB_0_18': 'uint8', 'QN_MOB_0_19': 'uint8', 'QN_MOB_0_20': 'uint8', 'QN_MOB_0_21': 'uint8', 'QN_MOB_0_22': 'uint8', 'QN_MOB_0_23': 'uint8', 'QN_MOB_0_24': 'uint8', 'QN_MOB_0_25': 'uint8', 'QN_MOB_0_26': 'uint8', 'QN_MOB_0_27': 'uint8', 'P_ATT_0_0': 'uint8', 'P_ATT_0_1': 'uint8', 'P_ATT_0_2': 'uint8', 'P_ATT_0_3': 'uint8', 'P_ATT_0_4': 'uint8', 'P_ATT_0_5': 'uint8', 'KN_ATT_0_0': 'uint8', 'KN_ATT_0_1': 'uint8', 'KN_ATT_0_2': 'uint8', 'KN_ATT_0_3': 'uint8', 'KN_ATT_0_4': 'uint8', 'KN_ATT_0_5': 'uint8', 'BISH_ATT_0_0': 'uint8', 'BISH_ATT_0_1': 'uint8', 'BISH_ATT_0_2': 'uint8', 'BISH_ATT_0_3': 'uint8', 'BISH_ATT_0_4': 'uint8', 'BISH_ATT_0_5': 'uint8', 'ROOK_ATT_0_0': 'uint8', 'ROOK_ATT_0_1': 'uint8', 'ROOK_ATT_0_2': 'uint8', 'ROOK_ATT_0_3': 'uint8', 'ROOK_ATT_0_4': 'uint8', 'ROOK_ATT_0_5': 'uint8', 'QN_ATT_0_0': 'uint8', 'QN_ATT_0_1': 'uint8', 'QN_ATT_0_2': 'uint8', 'QN_ATT_0_3': 'uint8', 'QN_ATT_0_4': 'uint8', 'QN_ATT_0_5': 'uint8', 'DOUBL_0': 'uint8', 'BISH_PAIR_0': 'uint8',
-'MAT_1_0': 'uint8', 'MAT_1_1': 'uint8', 'MAT_1_2': 'uint8', 'MAT_1_3': 'uint8', 'MAT_1_4': 'uint8', 'MAT_1_5': 'uint8', 'PSQT_1_0_0': 'uint8', 'PSQT_1_0_1': 'uint8', 'PSQT_1_0_2': 'uint8', 'PSQT_1_0_3': 'uint8', 'PSQT_1_0_4': 'uint8', 'PSQT_1_0_5': 'uint8', 'PSQT_1_0_6': 'uint8', 'PSQT_1_0_7': 'uint8', 'PSQT_1_0_8': 'uint8', 'PSQT_1_0_9': 'uint8', 'PSQT_1_0_10': 'uint8', 'PSQT_1_0_11': 'uint8', 'PSQT_1_0_12': 'uint8', 'PSQT_1_0_13': 'uint8', 'PSQT_1_0_14': 'uint8', 'PSQT_1_0_15': 'uint8', 'PSQT_1_0_16': 'uint8', 'PSQT_1_0_17': 'uint8', 'PSQT_1_0_18': 'uint8', 'PSQT_1_0_19': 'uint8', 'PSQT_1_0_20': 'uint8', 'PSQT_1_0_21': 'uint8', 'PSQT_1_0_22': 'uint8', 'PSQT_1_0_23': 'uint8', 'PSQT_1_0_24': 'uint8', 'PSQT_1_0_25': 'uint8', 'PSQT_1_0_26': 'uint8', 'PSQT_1_0_27': 'uint8', 'PSQT_1_0_28': 'uint8', 'PSQT_1_0_29': 'uint8', 'PSQT_1_0_30': 'uint8', 'PSQT_1_0_31': 'uint8', 'PSQT_1_0_32': 'uint8', 'PSQT_1_0_33': 'uint8', 'PSQT_1_0_34': 'uint8', 'PSQT_1_0_35': 'uint8', 'PSQT_1_0_36': 'uint8', 'PSQT_1_0_37': 'uint8', 'PSQT_1_0_38': 'uint8', 'PSQT_1_0_39': 'uint8', 'PSQT_1_0_40': 'uint8', 'PSQT_1_0_41': 'uint8', 'PSQT_1_0_42': 'uint8', 'PSQT_1_0_43': 'uint8', 'PSQT_1_0_44': 'uint8', 'PSQT_1_0_45': 'uint8', 'PSQT_1_0_46': 'uint8', 'PSQT_1_0_47': 'uint8', 'PSQT_1_0_48': 'uint8', 'PSQT_1_0_49': 'uint8', 'PSQT_1_0_50': 'uint8', 'PSQT_1_0_51': 'uint8', 'PSQT_1_0_52': 'uint8', 'PSQT_1_0_53': 'uint8', 'PSQT_1_0_54': 'uint8', 'PSQT_1_0_55': 'uint8', 'PSQT_1_0_56': 'uint8', 'PSQT_1_0_57': 'uint8', 'PSQT_1_0_58': 'uint8', 'PSQT_1_0_59': 'uint8', 'PSQT_1_0_60': 'uint8', 'PSQT_1_0_61': 'uint8', 'PSQT_1_0_62': 'uint8', 'PSQT_1_0_63': 'uint8', 'PSQT_1_1_0': 'uint8', 'PSQT_1_1_1': 'uint8', 'PSQT_1_1_2': 'uint8', 'PSQT_1_1_3': 'uint8', 'PSQT_1_1_4': 'uint8', 'PSQT_1_1_5': 'uint8', 'PSQT_1_1_6': 'uint8', 'PSQT_1_1_7': 'uint8', 'PSQT_1_1_8': 'uint8', 'PSQT_1_1_9': 'uint8', 'PSQT_1_1_10': 'uint8', 'PSQT_1_1_11': 'uint8', 'PSQT_1_1_12': 'uint8', 'PSQT_1_1_13': 'uint8', 'PSQT_1_1_14': 'uint8', 'PSQT_1_1_15': 'uint8', 'PSQT_1_1_16': 'uint8', 'PSQT_1_1_17': 'uint8', 'PSQT_1_1_18': 'uint8', 'PSQT_1_1_19': 'uint8', 'PSQT_1_1_20': 'uint8', 'PSQT_1_1_21': 'uint8', 'PSQT_1_1_22': 'uint8', 'PSQT_1_1_23': 'uint8', 'PSQT_1_1_24': 'uint8', 'PSQT_1_1_25': 'uint8', 'PSQT_1_1_26': 'uint8', 'PSQT_1_1_27': 'uint8', 'PSQT_1_1_28': 'uint8', 'PSQT_1_1_29': 'uint8', 'PSQT_1_1_30': 'uint8', 'PSQT_1_1_31': 'uint8', 'PSQT_1_1_32': 'uint8', 'PSQT_1_1_33': 'uint8', 'PSQT_1_1_34': 'uint8', 'PSQT_1_1_35': 'uint8', 'PSQT_1_1_36': 'uint8', 'PSQT_1_1_37': 'uint8', 'PSQT_1_1_38': 'uint8', 'PSQT_1_1_39': 'uint8', 'PSQT_1_1_40': 'uint8', 'PSQT_1_1_41': 'uint8', 'PSQT_1_1_42': 'uint8', 'PSQT_1_1_43': 'uint8', 'PSQT_1_1_44': 'uint8', 'PSQT_1_1_45': 'uint8', 'PSQT_1_1_46': 'uint8', 'PSQT_1_1_47': 'uint8', 'PSQT_1_1_48': 'uint8', 'PSQT_1_1_49': 'uint8', 'PSQT_1_1_50': 'uint8', 'PSQT_1_1_51': 'uint8', 'PSQT_1_1_52': 'uint8', 'PSQT_1_1_53': 'uint8', 'PSQT_1_1_54': 'uint8', 'PSQT_1_1_55': 'uint8', 'PSQT_1_1_56': 'uint8', 'PSQT_1_1_57': 'uint8', 'PSQT_1_1_58': 'uint8', 'PSQT_1_1_59': 'uint8', 'PSQT_1_1_60': 'uint8', 'PSQT_1_1_61': 'uint8', 'PSQT_1_1_62': 'uint8', 'PSQT_1_1_63': 'uint8', 'PSQT_1_2_0': 'uint8', 'PSQT_1_2_1': 'uint8', 'PSQT_1_2_2': 'uint8', 'PSQT_1_2_3': 'uint8', 'PSQT_1_2_4': 'uint8', 'PSQT_1_2_5': 'uint8', 'PSQT_1_2_6': 'uint8', 'PSQT_1_2_7': 'uint8', 'PSQT_1_2_8': 'uint8', 'PSQT_1_2_9': 'uint8', 'PSQT_1_2_10': 'uint8', 'PSQT_1_2_11': 'uint8', 'PSQT_1_2_12': 'uint8', 'PSQT_1_2_13': 'uint8', 'PSQT_1_2_14': 'uint8', 'PSQT_1_2_15': 'uint8', 'PSQT_1_2_16': 'uint8', 'PSQT_1_2_17': 'uint8', 'PSQT_1_2_18': 'uint8', 'PSQT_1_2_19': 'uint8', 'PSQT_1_2_20': 'uint8', 'PSQT_1_2_21': 'uint8', 'PSQT_1_2_22': 'uint8', 'PSQT_1_2_23': 'uint8', 'PSQT_1_2_24': 'uint8', 'PSQT_1_2_25': 'uint8', 'PSQT_1_2_26': 'uint8', 'PSQT_1_2_27': 'uint8', 'PSQT_1_2_28': 'uint8', 'PSQT_1_2_29': 'uint8', 'PSQT_1_2_30': 'uint8', 'PSQT_1_2_31': 'uint8', 'PSQT_1_2_32': 'uint8', 'PSQT_1_2_33': 'uint8', 'PSQT_1_2_34': 'uint8', 'PSQT_1_2_35': 'uint8', 'PSQT_1_2_36': 'uint8', 'PSQT_1_2_37': 'uint8', 'PSQT_1_2_38': 'uint8', 'PSQT_1_2_39': 'uint8', 'PSQT_1_2_40': 'uint8', 'PSQT_1_2_41': 'uint8', 'PSQT_1_2_42': 'uint8', 'PSQT_1_2_43': 'uint8', 'PSQT_1_2_44': 'uint8', 'PSQT_1_2_45': 'uint8', 'PSQT_1_2_46': 'uint8', 'PSQT_1_2_47': 'uint8', 'PSQT_1_2_48': 'uint8', 'PSQT_1_2_49': 'uint8', 'PSQT_1_2_50': 'uint8', 'PSQT_1_2_51': 'uint8', 'PSQT_1_2_52': 'uint8', 'PSQT_1_2_53': 'uint8', 'PSQT_1_2_54': 'uint8', 'PSQT_1_2_55': 'uint8', 'PSQT_1_2_56': 'uint8', 'PSQT_1_2_57': 'uint8', 'PSQT_1_2_58': 'uint8', 'PSQT_1_2_59': 'uint8', 'PSQT_1_2_60': 'uint8', 'PSQT_1_2_61': 'uint8', 'PSQT_1_2_62': 'uint8', 'PSQT_1_2_63': 'uint8', 'PSQT_1_3_0': 'uint8', 'PSQT_1_3_1': 'uint8', 'PSQT_1_3_2': 'uint8', 'PSQT_1_3_3': 'uint8', 'PSQT_1_3_4': 'uint8', 'PSQT_1_3_5': 'uint8', 'PSQT_1_3_6': 'uint8', 'PSQT_1_3_7': 'uint8', 'PSQT_1_3_8': 'uint8', 'PSQT_1_3_9': 'uint8', 'PSQT_1_3_10': 'uint8', 'PSQT_1_3_11': 'uint8', 'PSQT_1_3_12': 'uint8', 'PSQT_1_3_13': 'uint8', 'PSQT_1_3_14': 'uint8', 'PSQT_1_3_15': 'uint8', 'PSQT_1_3_16': 'uint8', 'PSQT_1_3_17': 'uint8', 'PSQT_1_3_18': 'uint8', 'PSQT_1_3_19': 'uint8', 'PSQT_1_3_20': 'uint8', 'PSQT_1_3_21': 'uint8', 'PSQT_1_3_22': 'uint8', 'PSQT_1_3_23': 'uint8', 'PSQT_1_3_24': 'uint8', 'PSQT_1_3_25': 'uint8', 'PSQT_1_3_26': 'uint8', 'PSQT_1_3_27': 'uint8', 'PSQT_1_3_28': 'uint8', 'PSQT_1_3_29': 'uint8', 'PSQT_1_3_30': 'uint8', 'PSQT_1_3_31': 'uint8', 'PSQT_1_3_32': 'uint8', 'PSQT_1_3_33': 'uint8', 'PSQT_1_3_34': 'uint8', 'PSQT_1_3_35': 'uint8', 'PSQT_1_3_36': 'uint8', 'PSQT_1_3_37': 'uint8', 'PSQT_1_3_38': 'uint8', 'PSQT_1_3_39': 'uint8', 'PSQT_1_3_40': 'uint8', 'PSQT_1_3_41': 'uint8', 'PSQT_1_3_42': 'uint8', 'PSQT_1_3_43': 'uint8', 'PSQT_1_3_44': 'uint8', 'PSQT_1_3_45': 'uint8', 'PSQT_1_3_46': 'uint8', 'PSQT_1_3_47': 'uint8', 'PSQT_1_3_48': 'uint8', 'PSQT_1_3_49': 'uint8', 'PSQT_1_3_50': 'uint8', 'PSQT_1_3_51': 'uint8', 'PSQT_1_3_52': 'uint8', 'PSQT_1_3_53': 'uint8', 'PSQT_1_3_54': 'uint8', 'PSQT_1_3_55': 'uint8', 'PSQT_1_3_56': 'uint8', 'PSQT_1_3_57': 'uint8', 'PSQT_1_3_58': 'uint8', 'PSQT_1_3_59': 'uint8', 'PSQT_1_3_60': 'uint8', 'PSQT_1_3_61': 'uint8', 'PSQT_1_3_62': 'uint8', 'PSQT_1_3_63': 'uint8', 'PSQT_1_4_0': 'uint8', 'PSQT_1_4_1': 'uint8', 'PSQT_1_4_2': 'uint8', 'PSQT_1_4_3': 'uint8', 'PSQT_1_4_4': 'uint8', 'PSQT_1_4_5': 'uint8', 'PSQT_1_4_6': 'uint8', 'PSQT_1_4_7': 'uint8', 'PSQT_1_4_8': 'uint8', 'PSQT_1_4_9': 'uint8', 'PSQT_1_4_10': 'uint8', 'PSQT_1_4_11': 'uint8', 'PSQT_1_4_12': 'uint8', 'PSQT_1_4_13': 'uint8', 'PSQT_1_4_14': 'uint8', 'PSQT_1_4_15': 'uint8', 'PSQT_1_4_16': 'uint8', 'PSQT_1_4_17': 'uint8', 'PSQT_1_4_18': 'uint8', 'PSQT_1_4_19': 'uint8', 'PSQT_1_4_20': 'uint8', 'PSQT_1_4_21': 'uint8', 'PSQT_1_4_22': 'uint8', 'PSQT_1_4_23': 'uint8', 'PSQT_1_4_24': 'uint8', 'PSQT_1_4_25': 'uint8', 'PSQT_1_4_26': 'uint8', 'PSQT_1_4_27': 'uint8', 'PSQT_1_4_28': 'uint8', 'PSQT_1_4_29': 'uint8', 'PSQT_1_4_30': 'uint8', 'PSQT_1_4_31': 'uint8', 'PSQT_1_4_32': 'uint8', 'PSQT_1_4_33': 'uint8', 'PSQT_1_4_34': 'uint8', 'PSQT_1_4_35': 'uint8', 'PSQT_1_4_36': 'uint8', 'PSQT_1_4_37': 'uint8', 'PSQT_1_4_38': 'uint8', 'PSQT_1_4_39': 'uint8', 'PSQT_1_4_40': 'uint8', 'PSQT_1_4_41': 'uint8', 'PSQT_1_4_42': 'uint8', 'PSQT_1_4_43': 'uint8', 'PSQT_1_4_44': 'uint8', 'PSQT_1_4_45': 'uint8', 'PSQT_1_4_46': 'uint8', 'PSQT_1_4_47': 'uint8', 'PSQT_1_4_48': 'uint8', 'PSQT_1_4_49': 'uint8', 'PSQT_1_4_50': 'uint8', 'PSQT_1_4_51': 'uint8', 'PSQT_1_4_52': 'uint8', 'PSQT_1_4_53': 'uint8', 'PSQT_1_4_54': 'uint8', 'PSQT_1_4_55': 'uint8', 'PSQT_1_4_56': 'uint8', 'PSQT_1_4_57': 'uint8', 'PSQT_1_4_58': 'uint8', 'PSQT_1_4_59': 'uint8', 'PSQT_1_4_60': 'uint8', 'PSQT_1_4_61': 'uint8', 'PSQT_1_4_62': 'uint8', 'PSQT_1_4_63': 'uint8', 'PSQT_1_5_0': 'uint8', 'PSQT_1_5_1': 'uint8', 'PSQT_1_5_2': 'uint8', 'PSQT_1_5_3': 'uint8', 'PSQT_1_5_4': 'uint8', 'PSQT_1_5_5': 'uint8', 'PSQT_1_5_6': 'uint8', 'PSQT_1_5_7': 'uint8', 'PSQT_1_5_8': 'uint8', 'PSQT_1_5_9': 'uint8', 'PSQT_1_5_10': 'uint8', 'PSQT_1_5_11': 'uint8', 'PSQT_1_5_12': 'uint8', 'PSQT_1_5_13': 'uint8', 'PSQT_1_5_14': 'uint8', 'PSQT_1_5_15': 'uint8', 'PSQT_1_5_16': 'uint8', 'PSQT_1_5_17': 'uint8', 'PSQT_1_5_18': 'uint8', 'PSQT_1_5_19': 'uint8', 'PSQT_1_5_20': 'uint8', 'PSQT_1_5_21': 'uint8', 'PSQT_1_5_22': 'uint8', 'PSQT_1_5_23': 'uint8', 'PSQT_1_5_24': 'uint8', 'PSQT_1_5_25': 'uint8', 'PSQT_1_5_26': 'uint8', 'PSQT_1_5_27': 'uint8', 'PSQT_1_5_28': 'uint8', 'PSQT_1_5_29': 'uint8', 'PSQT_1_5_30': 'uint8', 'PSQT_1_5_31': 'uint8', 'PSQT_1_5_32': 'uint8', 'PSQT_1_5_33': 'uint8', 'PSQT_1_5_34': 'uint8', 'PSQT_1_5_35': 'uint8', 'PSQT_1_5_36': 'uint8', 'PSQT_1_5_37': 'uint8', 'PSQT_1_5_38': 'uint8', 'PSQT_1_5_39': 'uint8', 'PSQT_1_5_40': 'uint8', 'PSQT_1_5_41': 'uint8', 'PSQT_1_5_42': 'uint8', 'PSQT_1_5_43': 'uint8', 'PSQT_1_5_44': 'uint8', 'PSQT_1_5_45': 'uint8', 'PSQT_1_5_46': 'uint8', 'PSQT_1_5_47': 'uint8', 'PSQT_1_5_48': 'uint8', 'PSQT_1_5_49': 'uint8', 'PSQT_1_5_50': 'uint8', 'PSQT_1_5_51': 'uint8', 'PSQT_1_5_52': 'uint8', 'PSQT_1_5_53': 'uint8', 'PSQT_1_5_54': 'uint8', 'PSQT_1_5_55': 'uint8', 'PSQT_1_5_56': 'uint8', 'PSQT_1_5_57': 'uint8', 'PSQT_1_5_58': 'uint8', 'PSQT_1_5_59': 'uint8', 'PSQT_1_5_60': 'uint8', 'PSQT_1_5_61': 'uint8', 'PSQT_1_5_62': 'uint8', 'PSQT_1_5_63': 'uint8', 'PASSED_1_0': 'uint8', 'PASSED_1_1': 'uint8', 'PASSED_1_2': 'uint8', 'PASSED_1_3': 'uint8', 'PASSED_1_4': 'uint8', 'PASSED_1_5': 'uint8', 'PASSED_1_6': 'uint8', 'PASSED_1_7': 'uint8', 'PASSED_1_8': 'uint8', 'PASSED_1_9': 'uint8', 'PASSED_1_10': 'uint8', 'PASSED_1_11': 'uint8', 'PASSED_1_12': 'uint8', 'PASSED_1_13': 'uint8', 'PASSED_1_14': 'uint8', 'PASSED_1_15': 'uint8', 'PASSED_1_16': 'uint8', 'PASSED_1_17': 'uint8', 'PASSED_1_18': 'uint8', 'PASSED_1_19': 'uint8', 'PASSED_1_20': 'uint8', 'PASSED_1_21': 'uint8', 'PASSED_1_22': 'uint8', 'PASSED_1_23': 'uint8', 'PASSED_1_24': 'uint8', 'PASSED_1_25': 'uint8', 'PASSED_1_26': 'uint8', 'PASSED_1_27': 'uint8', 'PASSED_1_28': 'uint8', 'PASSED_1_29': 'uint8', 'PASSED_1_30': 'uint8', 'PASSED_1_31': 'uint8', 'PASSED_1_32': 'uint8', 'PASSED_1_33': 'uint8', 'PASSED_1_34': 'uint8', 'PASSED_1_35': 'uint8', 'PASSED_1_36': 'uint8', 'PASSED_1_37': 'uint8', 'PASSED_1_38': 'uint8', 'PASSED_1_39': 'uint8', 'PASSED_1_40': 'uint8', 'PASSED_1_41': 'uint8', 'PASSED_1_42': 'uint8', 'PASSED_1_43': 'uint8', 'PASSED_1_44': 'uint8', 'PASSED_1_45': 'uint8', 'PASSED_1_46': 'uint8', 'PASSED_1_47': 'uint8', 'PASSED_1_48': 'uint8', 'PASSED_1_49': 'uint8', 'PASSED_1_50': 'uint8', 'PASSED_1_51': 'uint8', 'PASSED_1_52': 'uint8', 'PASSED_1_53': 'uint8', 'PASSED_1_54': 'uint8', 'PASSED_1_55': 'uint8', 'PASSED_1_56': 'uint8', 'PASSED_1_57': 'uint8', 'PASSED_1_58': 'uint8', 'PASSED_1_59': 'uint8', 'PASSED_1_60': 'uint8', 'PASSED_1_61': 'uint8', 'PASSED_1_62': 'uint8', 'PASSED_1_63': 'uint8', 'ISOLATED_1_0': 'uint8', 'ISOLATED_1_1': 'uint8', 'ISOLATED_1_2': 'uint8', 'ISOLATED_1_3': 'uint8', 'ISOLATED_1_4': 'uint8', 'ISOLATED_1_5': 'uint8', 'ISOLATED_1_6': 'uint8', 'ISOLATED_1_7': 'uint8', 'BLOCKED_1_0': 'uint8', 'BLOCKED_1_1': 'uint8', 'BLOCKED_1_2': 'uint8', 'BLOCKED_1_3': 'uint8', 'BLOCKED_1_4': 'uint8', 'BLOCKED_1_5': 'uint8', 'BLOCKED_1_6': 'uint8', 'BLOCKED_1_7': 'uint8', 'SUPPORTED_1_0': 'uint8', 'SUPPORTED_1_1': 'uint8', 'SUPPORTED_1_2': 'uint8', 'SUPPORTED_1_3': 'uint8', 'SUPPORTED_1_4': 'uint8', 'SUPPORTED_1_5': 'uint8', 'SUPPORTED_1_6': 'uint8', 'SUPPORTED_1_7': 'uint8', 'PHAL_1_0': 'uint8', 'PHAL_1_1': 'uint8', 'PHAL_1_2': 'uint8', 'PHAL_1_3': 'uint8', 'PHAL_1_4': 'uint8', 'PHAL_1_5': 'uint8', 'PHAL_1_6': 'uint8', 'PHAL_1_7': 'uint8', 'KN_MOB_1_0': 'uint8', 'KN_MOB_1_1': 'uint8', 'KN_MOB_1_2': 'uint8', 'KN_MOB_1_3': 'uint8', 'KN_MOB_1_4': 'uint8', 'KN_MOB_1_5': 'uint8', 'KN_MOB_1_6': 'uint8', 'KN_MOB_1_7': 'uint8', 'KN_MOB_1_8': 'uint8', 'BISH_MOB_1_0': 'uint8', 'BISH_MOB_1_1': 'uint8', 'BISH_MOB_1_2': 'uint8', 'BISH_MOB_1_3': 'uint8', 'BISH_MOB_1_4': 'uint8', 'BISH_MOB_1_5': 'uint8', 'BISH_MOB_1_6': 'uint8', 'BISH_MOB_1_7': 'uint8', 'BISH_MOB_1_8': 'uint8', 'BISH_MOB_1_9': 'uint8', 'BISH_MOB_1_10': 'uint8', 'BISH_MOB_1_11': 'uint8', 'BISH_MOB_1_12': 'uint8', 'BISH_MOB_1_13': 'uint8', 'ROOK_MOB_1_0': 'uint8', 'ROOK_MOB_1_1': 'uint8', 'ROOK_MOB_1_2': 'uint8', 'ROOK_MOB_1_3': 'uint8', 'ROOK_MOB_1_4': 'uint8', 'ROOK_MOB_1_5': 'uint8', 'ROOK_MOB_1_6': 'uint8', 'ROOK_MOB_1_7': 'uint8', 'ROOK_MOB_1_8': 'uint8', 'ROOK_MOB_1_9': 'uint8', 'ROOK_MOB_1_10': 'uint8', 'ROOK_MOB_1_11': 'uint8', 'ROOK_MOB_1_12': 'uint8', 'ROOK_MOB_1_13': 'uint8', 'ROOK_MOB_1_14': 'uint8', 'QN_MOB_1_0': 'uint8', 'QN_MOB_1_1': 'uint8', 'QN_MOB_1_2': 'uint8', 'QN_MOB_1_3': 'uint8', 'QN_MOB_1_4': 'uint8', 'QN_MOB_1_5': 'uint8', 'QN_MOB_1_6': 'uint8', 'QN_MOB_1_7': 'uint8', 'QN_MOB_1_8': 'uint8', 'QN_MOB_1_9': 'uint8', 'QN_MOB_1_10': 'uint8', 'QN_MOB_1_11': 'uint8', 'QN_MOB_1_12': 'uint8', 'QN_MOB_1_13': 'uint8', 'QN_MOB_1_14': 'uint8', 'QN_MOB_1_15': 'uint8', 'QN_MOB_1_16': 'uint8', 'QN_MOB_1_17': 'uint8', 'QN_MOB_1_18': 'uint8', 'QN_MOB_1_19': 'uint8', 'QN_MOB_1_20': 'uint8', 'QN_MOB_1_21': 'uint8', 'QN_MOB_1_22': 'uint8', 'QN_MOB_1_23': 'uint8', 'QN_MOB_1_24': 'uint8', 'QN_MOB_1_25': 'uint8', 'QN_MOB_1_26': 'uint8', 'QN_MOB_1_27': 'uint8', 'P_ATT_1_0': 'uint8', 'P_ATT_1_1': 'uint8', 'P_ATT_1_2': 'uint8', 'P_ATT_1_3': 'uint8', 'P_ATT_1_4': 'uint8', 'P_ATT_1_5': 'uint8', 'KN_ATT_1_0': 'uint8', 'KN_ATT_1_1': 'uint8', 'KN_ATT_1_2': 'uint8', 'KN_ATT_1_3': 'uint8', 'KN_ATT_1_4': 'uint8', 'KN_ATT_1_5': 'uint8', 'BISH_ATT_1_0': 'uint8', 'BISH_ATT_1_1': 'uint8', 'BISH_ATT_1_2': 'uint8', 'BISH_ATT_1_3': 'uint8', 'BISH_ATT_1_4': 'uint8', 'BISH_ATT_1_5': 'uint8', 'ROOK_ATT_1_0': 'uint8', 'ROOK_ATT_1_1': 'uint8', 'ROOK_ATT_1_2': 'uint8', 'ROOK_ATT_1_3': 'uint8', 'ROOK_ATT_1_4': 'uint8', 'ROOK_ATT_1_5': 'uint8', 'QN_ATT_1_0': 'uint8', 'QN_ATT_1_1': 'uint8', 'QN_ATT_1_2': 'uint8', 'QN_ATT_1_3': 'uint8', 'QN_ATT_1_4': 'uint8', 'QN_ATT_1_5': 'uint8', 'DOUBL_1': 'uint8', 'BISH_PAIR_1': 'uint8',
-
-}
-
-if not os.path.exists(out_path):
-        os.makedirs(out_path)
-
-reader = pd.read_csv(in_path,chunksize=chunk_size,dtype=df_dtype)    
-
-for i, chunk in enumerate(reader):
-    out_file = out_path + "/data_{}.pkl".format(i+1)
-    with open(out_file, "wb") as f:
-        pickle.dump(chunk,f,pickle.HIGHEST_PROTOCOL)
\ No newline at end of file
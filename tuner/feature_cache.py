@@ -0,0 +1,313 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from convert import DEFAULT_ENGINE, Progress, convert_shard
+from feature_store import STORE_VERSION, FeatureStore, merge_stores
+
+# Content-addressed cache for converted feature shards. The positions of all input
+# EPD files are deduplicated and every file is cut into shards after lines chosen by
+# their hash. The cuts depend only on the content of the lines, so edits move the
+# shard boundaries only around the change; a shard is linked to earlier input only
+# through the removal of positions already seen in it or in an earlier file. Every
+# shard is stored under a key made from its content and a fingerprint of the Zig
+# sources that decide the features. Only shards whose key is not in the cache are
+# converted, so changing an evaluation value or adding a new EPD file does not redo
+# the work that is already done.
+#
+# cache/objects/<key>   converted shard (a feature store)
+# cache/index.json      size, fingerprint and last use of every object, and the
+#                       shard list of recently seen sets of input files
+
+SRC_DIR = os.path.join('..', 'src')
+# Files that decide which features are extracted from a position
+FEATURE_SOURCES = ['tuner.zig', 'evaluation.zig', 'position.zig', 'bitboard.zig', 'attacks.zig', 'lists.zig']
+INDEX_FILE = 'index.json'
+STAMP_FILE = 'cache_key'
+# Sets of input files remembered in the index
+MAX_INPUTS = 100
+# Longest shard as a multiple of the average shard size
+MAX_SHARD_FACTOR = 4
+# Lines hashed and checked for duplicates at once
+BLOCK_LINES = 1 << 16
+
+# Single line parameter tables such as const mg_pawn_table = [64]i32{ ... };
+PARAMETER_TABLE = re.compile(r'^((?:pub\s+)?const\s+\w+\s*=\s*\[\d+\]i32\s*)\{[^}]*\};')
+
+
+def normalize_source(text):
+    # Tuned values and the tuner mode (see tuner.py) do not change the features,
+    # so both are removed before hashing
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith('//') and ('// TUNER ON' in line[2:] or '// TUNER OFF' in line[2:] or line.startswith('//tnr.')):
+            line = line[2:].strip()
+        line = PARAMETER_TABLE.sub(r'\1{}', line)
+        if line:
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+def source_fingerprint(src_dir):
+    digest = hashlib.sha256(f'store {STORE_VERSION}\n'.encode())
+    for name in FEATURE_SOURCES:
+        with open(os.path.join(src_dir, name), 'r') as file:
+            digest.update(f'{name}\n{normalize_source(file.read())}\n'.encode())
+    return digest.hexdigest()
+
+
+def check_engine(engine, src_dir):
+    # The fingerprint is taken from the sources, so the engine must be built from them
+    if not os.path.exists(engine):
+        raise FileNotFoundError(f'{engine} not found, build the engine in tuner mode (see README) or pass --engine')
+    newest = max(FEATURE_SOURCES, key=lambda name: os.path.getmtime(os.path.join(src_dir, name)))
+    if os.path.getmtime(engine) < os.path.getmtime(os.path.join(src_dir, newest)):
+        raise RuntimeError(f'{engine} is older than {newest}, build the engine in tuner mode again (see README)')
+
+
+def input_fingerprint(paths, fingerprint, shard_size):
+    # Cheap key of a pipeline run: sources, shard size and name, size and mtime of the inputs
+    digest = hashlib.sha256(f'{fingerprint} {shard_size}\n'.encode())
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(f'{os.path.abspath(path)} {stat.st_size} {stat.st_mtime_ns}\n'.encode())
+    return digest.hexdigest()
+
+
+class SeenPositions:
+    # 64-bit hashes of the lines seen so far in one sorted array, 8 bytes per unique
+    # position instead of about 100 for a set of digests
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def new_lines(self, lines, stats):
+        # (line, hash) of the lines seen neither before nor earlier in the block
+        stats['lines'] += len(lines)
+        if not lines:
+            return []
+        hashes = np.frombuffer(b''.join(hashlib.blake2b(line, digest_size=16).digest()[:8] for line in lines), dtype='<u8')
+        _, first = np.unique(hashes, return_index=True)
+        new = np.zeros(len(lines), dtype=bool)
+        new[first] = True
+        if len(self.hashes):
+            found = self.hashes[np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)] == hashes
+            new &= ~found
+        stats['duplicates'] += len(lines) - int(new.sum())
+
+        added = np.sort(hashes[new])
+        self.hashes = np.insert(self.hashes, np.searchsorted(self.hashes, added), added)
+        return [(lines[i], int(hashes[i])) for i in np.flatnonzero(new)]
+
+
+def unique_positions(path, seen, stats):
+    # Normalised EPD lines of a file with their hashes, every line only the first time it is seen
+    with open(path, 'rb') as file:
+        block = []
+        for line in file:
+            line = b' '.join(line.split())
+            if line:
+                block.append(line)
+                if len(block) == BLOCK_LINES:
+                    yield from seen.new_lines(block, stats)
+                    block = []
+        yield from seen.new_lines(block, stats)
+
+
+def split_shards(paths, fingerprint, shard_size, stats):
+    # Yields (key, lines) for shards of about shard_size unique positions. A shard ends
+    # after a line whose hash is divisible by shard_size, at MAX_SHARD_FACTOR * shard_size
+    # lines or at the end of a file, so unchanged parts of the inputs keep their keys
+    seen = SeenPositions()
+    for path in paths:
+        lines = []
+        for line, line_hash in unique_positions(path, seen, stats):
+            lines.append(line)
+            if line_hash % shard_size == 0 or len(lines) >= MAX_SHARD_FACTOR * shard_size:
+                yield shard_key(fingerprint, lines), lines
+                lines = []
+        if lines:
+            yield shard_key(fingerprint, lines), lines
+
+
+def shard_key(fingerprint, lines):
+    digest = hashlib.sha256(fingerprint.encode())
+    for line in lines:
+        digest.update(line + b'\n')
+    return digest.hexdigest()
+
+
+def directory_size(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class FeatureCache:
+    def __init__(self, path):
+        self.path = path
+        self.objects_dir = os.path.join(path, 'objects')
+        self.tmp_dir = os.path.join(path, 'tmp')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        # Leftovers of an interrupted run
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        os.makedirs(self.tmp_dir)
+
+        self.index = {'objects': {}, 'inputs': {}}
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, 'r') as file:
+                self.index = json.load(file)
+
+    def object_path(self, key):
+        return os.path.join(self.objects_dir, key)
+
+    def has(self, key):
+        return key in self.index['objects'] and os.path.exists(os.path.join(self.object_path(key), 'schema.json'))
+
+    def add(self, key, tmp_path, fingerprint):
+        path = self.object_path(key)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+        self.index['objects'][key] = {
+            'fingerprint': fingerprint, 'positions': len(FeatureStore(path)),
+            'size': directory_size(path), 'last_used': time.time(),
+        }
+
+    def touch(self, keys):
+        now = time.time()
+        for key in keys:
+            self.index['objects'][key]['last_used'] = now
+
+    def evict(self, max_size, fingerprint, keep):
+        # Objects of other source fingerprints go first, then the least recently used ones
+        objects = self.index['objects']
+        total = sum(entry['size'] for entry in objects.values())
+        order = sorted((key for key in objects if key not in keep),
+                       key=lambda key: (objects[key]['fingerprint'] == fingerprint, objects[key]['last_used']))
+        evicted = []
+        for key in order:
+            if total <= max_size:
+                break
+            total -= objects[key]['size']
+            shutil.rmtree(self.object_path(key), ignore_errors=True)
+            del objects[key]
+            evicted.append(key)
+
+        inputs = sorted(self.index['inputs'].items(), key=lambda item: item[1]['last_used'], reverse=True)
+        self.index['inputs'] = {k: v for k, v in inputs[:MAX_INPUTS] if all(key in objects for key in v['shards'])}
+        return evicted, total
+
+    def save(self):
+        tmp_path = os.path.join(self.path, INDEX_FILE + '.tmp')
+        with open(tmp_path, 'w') as file:
+            json.dump(self.index, file, indent=2)
+        os.replace(tmp_path, os.path.join(self.path, INDEX_FILE))
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+def read_stamp(path):
+    try:
+        with open(os.path.join(path, STAMP_FILE), 'r') as file:
+            key = file.read().strip()
+        FeatureStore(path)
+        return key
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert EPD files into a feature store, reusing shards converted before.')
+    parser.add_argument('inputs', type=str, nargs='+', help='EPD files with positions and results')
+    parser.add_argument('--output', type=str, default='data', help='Feature store directory to write')
+    parser.add_argument('--cache', type=str, default='cache', help='Cache directory')
+    parser.add_argument('--engine', type=str, default=DEFAULT_ENGINE, help='Engine compiled in tuner mode')
+    parser.add_argument('--src', type=str, default=SRC_DIR, help='Zig sources of the engine')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Number of converter processes')
+    parser.add_argument('--shard-size', type=int, default=250000, help='Average unique positions per shard')
+    parser.add_argument('--max-size', type=float, default=20.0, help='Cache size limit in GB')
+    parser.add_argument('--force', action='store_true', help='Convert every shard again')
+    args = parser.parse_args()
+
+    start = time.time()
+    cache = FeatureCache(args.cache)
+    fingerprint = source_fingerprint(args.src)
+    inputs_key = input_fingerprint(args.inputs, fingerprint, args.shard_size)
+    print(f"Source fingerprint {fingerprint[:16]}")
+
+    known = cache.index['inputs'].get(inputs_key)
+    if not args.force and known and all(cache.has(key) for key in known['shards']):
+        # Same inputs and sources as a previous run, nothing has to be read
+        keys, pending = known['shards'], []
+        print(f"Inputs unchanged, {len(keys)} shards in cache")
+    else:
+        keys, pending = [], []
+        stats = {'lines': 0, 'duplicates': 0}
+        for key, lines in split_shards(args.inputs, fingerprint, args.shard_size, stats):
+            if args.force or not cache.has(key):
+                epd_path = os.path.join(cache.tmp_dir, key + '.epd')
+                with open(epd_path, 'wb') as file:
+                    file.write(b'\n'.join(lines) + b'\n')
+                pending.append((key, epd_path))
+            keys.append(key)
+        print(f"Read {stats['lines']} positions, {stats['duplicates']} duplicates removed, "
+              f"{len(keys)} shards of which {len(keys) - len(pending)} in cache")
+
+    if not keys:
+        raise ValueError('No positions in the input files')
+
+    if pending:
+        check_engine(args.engine, args.src)
+        progress = Progress(len(pending))
+
+        def convert(i, key, epd_path):
+            tmp_path = os.path.join(cache.tmp_dir, key)
+            convert_shard(args.engine, epd_path, tmp_path, 0, os.path.getsize(epd_path), i, progress)
+            os.remove(epd_path)
+            return tmp_path
+
+        failed = []
+        try:
+            with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+                futures = [(key, executor.submit(convert, i, key, epd_path)) for i, (key, epd_path) in enumerate(pending)]
+                for key, future in futures:
+                    try:
+                        cache.add(key, future.result(), fingerprint)
+                    except Exception as error:
+                        failed.append(error)
+        finally:
+            # Shards converted before a failure or an interrupt are reused by the next run
+            cache.save()
+        if failed:
+            raise RuntimeError(f'{len(failed)} of {len(pending)} shards failed') from failed[0]
+        print(f"Converted {len(pending)} shards in {time.time() - start:.1f}s")
+
+    cache.touch(keys)
+    cache.index['inputs'][inputs_key] = {'shards': keys, 'last_used': time.time()}
+
+    merged_key = hashlib.sha256('\n'.join(keys).encode()).hexdigest()
+    if read_stamp(args.output) == merged_key:
+        print(f"{args.output} is up to date")
+    else:
+        stamp_path = os.path.join(args.output, STAMP_FILE)
+        if os.path.exists(stamp_path):
+            os.remove(stamp_path)
+        store = merge_stores([cache.object_path(key) for key in keys], args.output)
+        with open(stamp_path, 'w') as file:
+            file.write(merged_key + '\n')
+        print(f"Wrote {len(store)} positions to {args.output}")
+
+    evicted, total = cache.evict(args.max_size * (1 << 30), fingerprint, set(keys))
+    cache.save()
+    if evicted:
+        print(f"Evicted {len(evicted)} shards")
+    print(f"Cache size {total / (1 << 30):.2f} GB, done in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
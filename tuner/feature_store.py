@@ -0,0 +1,179 @@
+import argparse
+import copy
+import json
+import os
+
+import numpy as np
+
+# Reader for the sparse feature store written by Tuner.convertDataset (see
+# SparseWriter in src/tuner.zig). Every array is memory-mapped straight from its
+# .bin file, nothing is parsed or copied until it is used.
+
+STORE_FORMAT = 'lambergar-sparse'
+STORE_VERSION = 2
+# Version 1 stores have no target array and are still read
+READABLE_VERSIONS = (1, STORE_VERSION)
+SCHEMA_FILE = 'schema.json'
+
+# Offset arrays and the arrays they point into
+OFFSET_ARRAYS = {'row_offsets': 'feature_index', 'fen_offsets': 'fen'}
+
+
+def open_array(path, spec, mode='r'):
+    shape = tuple(spec['shape'])
+    dtype = np.dtype(spec['dtype'])
+    if int(np.prod(shape)) == 0:
+        # mmap cannot map empty files
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(os.path.join(path, spec['file']), dtype=dtype, mode=mode, shape=shape)
+
+
+def field_columns(name, shape, color):
+    # Column names as they used to appear in the data.csv header, e.g. PSQT_0_1_12
+    if len(shape) == 0:
+        return [f'{name}_{color}']
+    return [f'{name}_{color}_' + '_'.join(map(str, idx)) for idx in np.ndindex(*shape)]
+
+
+class FeatureStore:
+    def __init__(self, path):
+        self.path = path
+
+        with open(os.path.join(path, SCHEMA_FILE), 'r') as file:
+            self.schema = json.load(file)
+
+        if self.schema.get('format') != STORE_FORMAT:
+            raise ValueError(f'{path} is not a {STORE_FORMAT} store')
+        if self.schema.get('version') not in READABLE_VERSIONS:
+            raise ValueError(f'{path} has store version {self.schema.get("version")}, expected one of {READABLE_VERSIONS}')
+        self.version = self.schema['version']
+
+        self.n_positions = self.schema['positions']
+        self.n_entries = self.schema['entries']
+        self.n_features = self.schema['features_per_color']
+        self.fields = [(f['name'], tuple(f['shape'])) for f in self.schema['fields']]
+
+        self.arrays = {name: open_array(path, spec) for name, spec in self.schema['arrays'].items()}
+        self.row_offsets = self.arrays['row_offsets']
+        self.feature_index = self.arrays['feature_index']
+        self.feature_count = self.arrays['feature_count']
+        self.result = self.arrays['result']
+        # Training label in [0, 1], missing in stores written before labels were read from the EPD
+        self.target = self.arrays.get('target')
+        self.phase = self.arrays['phase']
+        self.fen_offsets = self.arrays['fen_offsets']
+        self.fen_bytes = self.arrays['fen']
+
+        if len(self.row_offsets) != self.n_positions + 1 or self.row_offsets[-1] != self.n_entries:
+            raise ValueError(f'{path} has inconsistent row offsets')
+
+    def __len__(self):
+        return self.n_positions
+
+    def columns(self):
+        # White columns followed by black columns, same order as the feature indices
+        names = []
+        for color in range(self.schema['colors']):
+            for name, shape in self.fields:
+                names += field_columns(name, shape, color)
+        return names
+
+    def field_lengths(self):
+        return [int(np.prod(shape)) for _, shape in self.fields]
+
+    def fen(self, i):
+        return bytes(self.fen_bytes[self.fen_offsets[i]:self.fen_offsets[i + 1]]).decode('ascii')
+
+    def fens(self, start=0, stop=None):
+        stop = self.n_positions if stop is None else stop
+        return [self.fen(i) for i in range(start, stop)]
+
+    def rows(self, start=0, stop=None):
+        # CSR view of positions [start, stop): (indptr, feature index, count)
+        stop = self.n_positions if stop is None else stop
+        lo, hi = int(self.row_offsets[start]), int(self.row_offsets[stop])
+        indptr = np.asarray(self.row_offsets[start:stop + 1], dtype=np.int64) - lo
+        return indptr, self.feature_index[lo:hi], self.feature_count[lo:hi]
+
+    def dense(self, start=0, stop=None, dtype=np.uint8):
+        # Materialises positions [start, stop) as rows of the old data.csv feature columns
+        stop = self.n_positions if stop is None else stop
+        indptr, index, count = self.rows(start, stop)
+        out = np.zeros((stop - start, 2 * self.n_features), dtype=dtype)
+        row = np.repeat(np.arange(stop - start), np.diff(indptr))
+        out[row, index] = count
+        return out
+
+
+def merge_stores(paths, out_path, block_size=1 << 24):
+    # Concatenates stores in the given order, so position i of the result is position
+    # i of the first store, followed by the positions of the second store and so on
+    stores = [FeatureStore(path) for path in paths]
+    if not stores:
+        raise ValueError('No stores to merge')
+    for store in stores[1:]:
+        if store.version != stores[0].version:
+            raise ValueError(f'{store.path} has store version {store.version} and {stores[0].path} version {stores[0].version}, '
+                             f'convert them again with the same engine')
+    layout = (stores[0].n_features, stores[0].schema['fields'], sorted(stores[0].schema['arrays']))
+    for store in stores[1:]:
+        if (store.n_features, store.schema['fields'], sorted(store.schema['arrays'])) != layout:
+            raise ValueError(f'{store.path} has a different layout than {stores[0].path}')
+
+    os.makedirs(out_path, exist_ok=True)
+    if os.path.exists(os.path.join(out_path, SCHEMA_FILE)):
+        os.remove(os.path.join(out_path, SCHEMA_FILE))
+    schema = copy.deepcopy(stores[0].schema)
+
+    for name, spec in schema['arrays'].items():
+        with open(os.path.join(out_path, spec['file']), 'wb') as file:
+            if name in OFFSET_ARRAYS:
+                base = 0
+                np.zeros(1, dtype=spec['dtype']).tofile(file)
+                for store in stores:
+                    (np.asarray(store.arrays[name][1:], dtype=np.uint64) + np.uint64(base)).astype(spec['dtype']).tofile(file)
+                    base += len(store.arrays[OFFSET_ARRAYS[name]])
+                length = sum(len(store) for store in stores) + 1
+            else:
+                for store in stores:
+                    array = store.arrays[name]
+                    for start in range(0, len(array), block_size):
+                        np.asarray(array[start:start + block_size]).tofile(file)
+                length = sum(len(store.arrays[name]) for store in stores)
+        spec['shape'] = [length] + list(spec['shape'][1:])
+
+    schema['positions'] = sum(len(store) for store in stores)
+    schema['entries'] = sum(store.n_entries for store in stores)
+
+    # The schema goes last, a store without one is incomplete
+    with open(os.path.join(out_path, SCHEMA_FILE), 'w') as file:
+        json.dump(schema, file, indent=2)
+
+    return FeatureStore(out_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect a sparse feature store.')
+    parser.add_argument('path', type=str, nargs='?', default='data', help='Store directory written by convertDataset')
+    parser.add_argument('--head', type=int, default=0, help='Print the first N positions')
+    args = parser.parse_args()
+
+    store = FeatureStore(args.path)
+    print(f"Positions: {store.n_positions}")
+    print(f"Entries: {store.n_entries} ({store.n_entries / max(store.n_positions, 1):.1f} per position)")
+    print(f"Features per color: {store.n_features}")
+
+    results, counts = np.unique(store.result, return_counts=True)
+    print(f"Results: {dict(zip(results.tolist(), counts.tolist()))}")
+    if store.target is not None and len(store):
+        print(f"Targets: mean {float(np.mean(store.target)):.4f}, min {float(np.min(store.target)):.4f}, max {float(np.max(store.target)):.4f}")
+
+    columns = store.columns()
+    indptr, index, count = store.rows(0, min(args.head, len(store)))
+    for i in range(len(indptr) - 1):
+        features = ' '.join(f'{columns[f]}={c}' for f, c in zip(index[indptr[i]:indptr[i + 1]], count[indptr[i]:indptr[i + 1]]))
+        print(f"{i}: {store.fen(i)} [{store.result[i]}] phase={tuple(store.phase[i].tolist())} {features}")
+
+
+if __name__ == "__main__":
+    main()
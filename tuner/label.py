@@ -0,0 +1,190 @@
+import argparse
+import math
+import os
+import queue
+import threading
+import time
+
+import texel
+from uci_engine import EngineError, UciEngine, score_cp
+
+# Labels EPD positions with the scores of a shallow search. A pool of engine
+# processes (one search thread each) stays running for the whole file; positions are
+# streamed to them through bounded queues and the labelled lines are written in input
+# order as soon as they are ready, so an interrupted run continues where it stopped.
+# The output has the "fen [label]" form that convertDataset reads as the target.
+
+DEFAULT_OPTIONS = {'Threads': 1}
+
+# Game results of labelled EPD lines
+RESULTS = {'0.0': 0.0, '0.5': 0.5, '1.0': 1.0}
+
+
+def read_positions(path, skip=0):
+    # (fen, game result or None) of every position after the first skip ones
+    with open(path, 'r') as file:
+        n = 0
+        for line in file:
+            fen, _, label = line.partition('[')
+            fen = fen.strip()
+            if not fen:
+                continue
+            n += 1
+            if n > skip:
+                yield fen, RESULTS.get(label.strip().rstrip(']'))
+
+
+def resume_point(path):
+    # Number of complete lines already written; a line cut off by a crash is removed
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb+') as file:
+        data = file.read()
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            file.truncate(end)
+    return data[:end].count(b'\n')
+
+
+def label(score, result, k, weight):
+    # Expected result for white from the side to move score, blended with the game result
+    p = 1 / (1 + math.exp(-k * score))
+    return p if result is None else weight * p + (1 - weight) * result
+
+
+class Worker:
+    def __init__(self, args, options):
+        self.args = args
+        self.options = options
+        self.engine = None
+        self.searched = 0
+
+    def search(self, fen):
+        if self.engine is None:
+            self.engine = UciEngine(self.args.engine, self.options)
+            self.engine.new_game()
+            self.searched = 0
+        elif self.args.newgame_every and self.searched % self.args.newgame_every == 0:
+            self.engine.new_game()
+
+        limits = {'nodes': self.args.nodes} if self.args.nodes else {'depth': self.args.depth}
+        self.engine.position(fen)
+        _, infos = self.engine.go(timeout=self.args.timeout, **limits)
+        self.searched += 1
+        scores = [info['score'] for info in infos if 'score' in info]
+        if not scores:
+            raise EngineError(f'{self.engine.name} gave no score for {fen}')
+        return score_cp(scores[-1], self.args.mate_score)
+
+    def restart(self):
+        if self.engine is not None:
+            self.engine.quit(timeout=1.0)
+        self.engine = None
+
+    def run(self, tasks, results):
+        try:
+            while True:
+                task = tasks.get()
+                if task is None:
+                    break
+                i, fen, result = task
+                for attempt in range(self.args.retries + 1):
+                    try:
+                        score = self.search(fen)
+                        break
+                    except (EngineError, TimeoutError):
+                        # A crashed or stuck engine is replaced and the position searched again
+                        self.restart()
+                        if attempt == self.args.retries:
+                            raise
+                if fen.split()[1] == 'b':
+                    score = -score
+                results.put((i, f'{fen} [{label(score, result, self.args.k, self.args.weight):.4f}]\n'))
+            results.put(None)
+        except Exception as e:
+            results.put(e)
+        finally:
+            self.restart()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Label EPD positions with search scores of a pool of engine processes.')
+    parser.add_argument('engine', type=str, help='Engine binary compiled in normal mode')
+    parser.add_argument('input', type=str, nargs='?', default='quiet-labeled.epd', help='EPD file, optionally with game results')
+    parser.add_argument('output', type=str, nargs='?', default='search-labeled.epd', help='Labelled EPD file, resumed if it exists')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Number of engine processes')
+    parser.add_argument('--depth', type=int, default=8, help='Search depth per position')
+    parser.add_argument('--nodes', type=int, default=0, help='Search nodes per position instead of the depth')
+    parser.add_argument('--hash', type=int, default=16, help='Hash size in MB of every engine')
+    parser.add_argument('--option', type=str, action='append', default=[], help='UCI option as Name=Value')
+    parser.add_argument('--newgame-every', type=int, default=0, help='Send ucinewgame every N positions (0 = only when an engine starts)')
+    parser.add_argument('--k', type=float, default=texel.K, help='Scale of the sigmoid turning centipawns into an expected result')
+    parser.add_argument('--weight', type=float, default=1.0, help='Weight of the search score against the game result')
+    parser.add_argument('--mate-score', type=int, default=2000, help='Centipawns used for mate scores')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Seconds a search may take before the engine is restarted')
+    parser.add_argument('--retries', type=int, default=2, help='Restarts of an engine for the same position')
+    parser.add_argument('--queue-size', type=int, default=64, help='Positions queued per engine')
+    args = parser.parse_args()
+
+    options = dict(DEFAULT_OPTIONS, Hash=args.hash)
+    for option in args.option:
+        name, _, value = option.partition('=')
+        options[name] = value
+    # Each engine searches one position at a time, parallelism comes from the pool
+    options['Threads'] = 1
+
+    done = resume_point(args.output)
+    if done:
+        print(f"Resuming after {done} positions already in {args.output}")
+
+    jobs = max(args.jobs, 1)
+    tasks = queue.Queue(maxsize=jobs * args.queue_size)
+    results = queue.Queue(maxsize=jobs * args.queue_size)
+    stop = threading.Event()
+
+    def feed():
+        for i, (fen, result) in enumerate(read_positions(args.input, done)):
+            if result is None and args.weight < 1:
+                print(f"Warning: no game result for {fen}, labelled with the search score only")
+            while not stop.is_set():
+                try:
+                    tasks.put((i, fen, result), timeout=0.5)
+                    break
+                except queue.Full:
+                    pass
+            if stop.is_set():
+                return
+        for _ in range(jobs):
+            tasks.put(None)
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    threads += [threading.Thread(target=Worker(args, options).run, args=(tasks, results), daemon=True) for _ in range(jobs)]
+    for thread in threads:
+        thread.start()
+
+    # Lines arrive in any order and are held back until all earlier ones are written
+    pending, next_index, running, start = {}, 0, jobs, time.time()
+    try:
+        with open(args.output, 'a') as out:
+            while running:
+                item = results.get()
+                if item is None:
+                    running -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                pending[item[0]] = item[1]
+                while next_index in pending:
+                    out.write(pending.pop(next_index))
+                    next_index += 1
+                    if next_index % 10_000 == 0:
+                        out.flush()
+                        print(f"{done + next_index} positions ({next_index / (time.time() - start):.0f}/s)", flush=True)
+    finally:
+        stop.set()
+
+    print(f"Labelled {next_index} positions in {time.time() - start:.0f}s, {done + next_index} in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
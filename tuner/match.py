@@ -0,0 +1,390 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import chess
+import chess.pgn
+
+from uci_engine import EngineError, UciEngine, score_cp
+
+# Self-play match between two engine binaries, e.g. a build with freshly tuned
+# parameters against the previous one. Every worker thread keeps its own pair of
+# engine processes and plays openings as game pairs with swapped colours. Games are
+# adjudicated from the engine scores, written to PGN and JSONL as soon as they end,
+# and the match stops as soon as the SPRT on the game pairs reaches a decision.
+
+# Options sent to both engines before --option values; the tuned parameters are
+# the HCE ones, so the NNUE is switched off
+DEFAULT_OPTIONS = {'Threads': 1, 'Hash': 16, 'UseNNUE': 'false'}
+
+RESULTS = {1.0: '1-0', 0.5: '1/2-1/2', 0.0: '0-1'}
+
+
+def read_openings(path):
+    openings = []
+    with open(path, 'r') as file:
+        for line in file:
+            # Labelled EPD lines end with the result, e.g. "... w - - [0.5]"
+            epd = line.split('[')[0].strip()
+            if not epd:
+                continue
+            fields = epd.split()
+            if len(fields) == 6 and fields[4].isdigit() and fields[5].isdigit():
+                # FEN with halfmove and fullmove clocks
+                board = chess.Board(epd)
+            else:
+                board = chess.Board()
+                board.set_epd(epd)
+            openings.append(board.fen())
+    return openings
+
+
+def parse_time_control(tc):
+    # "10+0.1" -> (10000, 100) milliseconds
+    base, _, inc = tc.partition('+')
+    return int(float(base) * 1000), int(float(inc or 0) * 1000)
+
+
+class Adjudicator:
+    # Scores are kept from the point of view of the engine that reported them
+    def __init__(self, args):
+        self.args = args
+        self.scores = {chess.WHITE: [], chess.BLACK: []}
+
+    def add(self, color, score):
+        self.scores[color].append(score)
+
+    def result(self, board):
+        a = self.args
+        white, black = self.scores[chess.WHITE], self.scores[chess.BLACK]
+        n = a.resign_moves
+        if len(white) >= n and len(black) >= n:
+            if all(s <= -a.resign_score for s in white[-n:]) and all(s >= a.resign_score for s in black[-n:]):
+                return 0.0, 'adjudication: white resigns'
+            if all(s <= -a.resign_score for s in black[-n:]) and all(s >= a.resign_score for s in white[-n:]):
+                return 1.0, 'adjudication: black resigns'
+
+        n = a.draw_moves
+        if board.fullmove_number >= a.draw_movenumber and len(white) >= n and len(black) >= n:
+            if all(abs(s) <= a.draw_score for s in white[-n:] + black[-n:]):
+                return 0.5, 'adjudication: draw'
+
+        if board.ply() >= 2 * a.max_moves:
+            return 0.5, 'adjudication: maximum length'
+        return None
+
+
+class EnginePair:
+    def __init__(self, paths, options):
+        self.paths = paths
+        self.options = options
+        self.engines = [None, None]
+
+    def get(self, i):
+        if self.engines[i] is None:
+            self.engines[i] = UciEngine(self.paths[i], self.options)
+        return self.engines[i]
+
+    def restart(self, i):
+        if self.engines[i] is not None:
+            self.engines[i].quit(timeout=1.0)
+        self.engines[i] = None
+
+    def close(self):
+        for i in range(2):
+            self.restart(i)
+
+
+def engine_failure(color, error):
+    # The side whose engine crashed or hung loses the game
+    return (0.0 if color == chess.WHITE else 1.0), f'{"white" if color == chess.WHITE else "black"} engine failure: {error}'
+
+
+def play_game(pair, opening, white, args, stop=None):
+    # white is the index of the engine playing white; returns the result for white,
+    # or None when the match is stopped before the game ends
+    board = chess.Board(opening)
+    adjudicator = Adjudicator(args)
+    base_ms, inc_ms = parse_time_control(args.tc)
+    clock = {chess.WHITE: base_ms, chess.BLACK: base_ms}
+    think_ms = {chess.WHITE: [], chess.BLACK: []}
+
+    for i in range(2):
+        try:
+            try:
+                pair.get(i).new_game()
+            except (EngineError, TimeoutError):
+                # Crashed in the previous game, start it again
+                pair.restart(i)
+                pair.get(i).new_game()
+        except (EngineError, TimeoutError) as e:
+            pair.restart(i)
+            result, termination = engine_failure(chess.WHITE if i == white else chess.BLACK, e)
+            return result, termination, board, think_ms
+
+    result = None
+    while result is None:
+        if stop is not None and stop.is_set():
+            return None
+        outcome = board.outcome(claim_draw=True)
+        if outcome is not None:
+            result = {True: 1.0, False: 0.0, None: 0.5}[outcome.winner], outcome.termination.name.lower()
+            break
+
+        color = board.turn
+        index = white if color == chess.WHITE else 1 - white
+        if args.nodes:
+            limits = {'nodes': args.nodes}
+        elif args.depth:
+            limits = {'depth': args.depth}
+        else:
+            limits = {'wtime': clock[chess.WHITE], 'btime': clock[chess.BLACK], 'winc': inc_ms, 'binc': inc_ms}
+
+        start = time.time()
+        try:
+            engine = pair.get(index)
+            engine.position(opening, [move.uci() for move in board.move_stack])
+            bestmove, infos = engine.go(timeout=clock[color] / 1000 + 10 if not (args.nodes or args.depth) else None, **limits)
+        except (EngineError, TimeoutError) as e:
+            pair.restart(index)
+            result = engine_failure(color, e)
+            break
+        elapsed = int((time.time() - start) * 1000)
+        think_ms[color].append(elapsed)
+
+        if not (args.nodes or args.depth):
+            clock[color] -= elapsed
+            if clock[color] < -args.time_margin:
+                result = (0.0 if color == chess.WHITE else 1.0), 'time forfeit'
+                break
+            clock[color] = max(clock[color], 0) + inc_ms
+
+        try:
+            move = chess.Move.from_uci(bestmove)
+        except ValueError:
+            move = None
+        if move is None or move not in board.legal_moves:
+            result = (0.0 if color == chess.WHITE else 1.0), f'illegal move {bestmove}'
+            break
+        board.push(move)
+
+        scores = [info['score'] for info in infos if 'score' in info]
+        if scores:
+            adjudicator.add(color, score_cp(scores[-1]))
+        result = adjudicator.result(board)
+
+    return result[0], result[1], board, think_ms
+
+
+class Sprt:
+    # GSPRT on game pairs (pentanomial counts), logistic Elo
+    def __init__(self, elo0, elo1, alpha, beta):
+        self.s0 = 1 / (1 + 10 ** (-elo0 / 400))
+        self.s1 = 1 / (1 + 10 ** (-elo1 / 400))
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+
+    @staticmethod
+    def stats(penta):
+        n = sum(penta)
+        if n == 0:
+            return 0, 0.5, 0.0
+        mean = sum(count * i / 4 for i, count in enumerate(penta)) / n
+        var = sum(count * (i / 4 - mean) ** 2 for i, count in enumerate(penta)) / n
+        return n, mean, var
+
+    def llr(self, penta):
+        n, mean, var = self.stats(penta)
+        if n == 0 or var == 0:
+            return 0.0
+        return n * (self.s1 - self.s0) * (2 * mean - self.s0 - self.s1) / (2 * var)
+
+    def decision(self, penta):
+        llr = self.llr(penta)
+        if llr >= self.upper:
+            return 'H1'
+        if llr <= self.lower:
+            return 'H0'
+        return None
+
+
+def elo(penta):
+    n, mean, var = Sprt.stats(penta)
+    if n == 0:
+        return 0.0, 0.0
+
+    def to_elo(score):
+        score = min(max(score, 1e-6), 1 - 1e-6)
+        return -400 * math.log10(1 / score - 1)
+
+    margin = 1.96 * math.sqrt(var / n)
+    return to_elo(mean), (to_elo(mean + margin) - to_elo(mean - margin)) / 2
+
+
+class Match:
+    def __init__(self, args, openings):
+        self.args = args
+        self.openings = openings
+        self.names = [args.name1 or os.path.basename(args.engine1), args.name2 or os.path.basename(args.engine2)]
+        self.options = dict(DEFAULT_OPTIONS)
+        for option in args.option:
+            name, _, value = option.partition('=')
+            self.options[name] = value
+
+        self.lock = threading.Lock()
+        self.pairs = itertools.count()
+        self.stop = threading.Event()
+        self.n_pairs = (args.games + 1) // 2
+        self.games = 0
+        # Results of engine1: wins, losses, draws and pentanomial counts of pair scores 0, 0.5, ..., 2
+        self.wld = [0, 0, 0]
+        self.penta = [0] * 5
+        self.sprt = Sprt(args.elo0, args.elo1, args.alpha, args.beta)
+        self.decision = None
+        self.start = time.time()
+
+        self.pgn = open(args.pgn, 'a')
+        self.log = open(args.log, 'a')
+
+    def worker(self):
+        pair = EnginePair([self.args.engine1, self.args.engine2], self.options)
+        try:
+            while not self.stop.is_set():
+                with self.lock:
+                    pair_index = next(self.pairs)
+                if pair_index >= self.n_pairs:
+                    return
+                opening = self.openings[pair_index % len(self.openings)]
+
+                pair_score = 0.0
+                for game in range(2):
+                    # engine1 has white in the first game of the pair
+                    white = game
+                    start = time.time()
+                    game_result = play_game(pair, opening, white, self.args, self.stop)
+                    if game_result is None:
+                        return
+                    result, termination, board, think_ms = game_result
+                    score = result if white == 0 else 1 - result
+                    pair_score += score
+                    self.record(pair_index, game, opening, white, result, termination, board, think_ms, time.time() - start)
+                    if self.stop.is_set():
+                        return
+                self.record_pair(pair_score)
+        finally:
+            pair.close()
+
+    def record(self, pair_index, game, opening, white, result, termination, board, think_ms, duration):
+        white_name, black_name = self.names[white], self.names[1 - white]
+        pgn_game = chess.pgn.Game.from_board(board)
+        pgn_game.headers.update({
+            'Event': self.args.event, 'Site': '?', 'Date': time.strftime('%Y.%m.%d'),
+            'Round': f'{pair_index + 1}.{game + 1}', 'White': white_name, 'Black': black_name,
+            'Result': RESULTS[result], 'TimeControl': '-' if self.args.nodes or self.args.depth else self.args.tc,
+            'Termination': termination,
+        })
+        if self.args.nodes:
+            pgn_game.comment = f'{self.args.nodes} nodes per move'
+        elif self.args.depth:
+            pgn_game.comment = f'depth {self.args.depth} per move'
+        if opening != chess.STARTING_FEN:
+            pgn_game.headers['FEN'] = opening
+            pgn_game.headers['SetUp'] = '1'
+
+        entry = {
+            'pair': pair_index + 1, 'game': game + 1, 'white': white_name, 'black': black_name,
+            'opening': opening, 'result': RESULTS[result], 'termination': termination, 'plies': board.ply(),
+            'duration': round(duration, 3),
+            'think_ms': {'white': sum(think_ms[chess.WHITE]), 'black': sum(think_ms[chess.BLACK])},
+            'moves': {'white': len(think_ms[chess.WHITE]), 'black': len(think_ms[chess.BLACK])},
+        }
+
+        score = result if white == 0 else 1 - result
+        with self.lock:
+            self.games += 1
+            self.wld[0 if score == 1 else 1 if score == 0 else 2] += 1
+            print(pgn_game, file=self.pgn, end='\n\n', flush=True)
+            self.log.write(json.dumps(entry) + '\n')
+            self.log.flush()
+
+    def record_pair(self, pair_score):
+        with self.lock:
+            self.penta[int(round(pair_score * 2))] += 1
+            llr = self.sprt.llr(self.penta)
+            elo_diff, margin = elo(self.penta)
+            print(f"Games {self.games}: {self.names[0]} vs {self.names[1]} +{self.wld[0]} -{self.wld[1]} ={self.wld[2]}, "
+                  f"Elo {elo_diff:+.1f} +- {margin:.1f}, LLR {llr:.2f} [{self.sprt.lower:.2f}, {self.sprt.upper:.2f}], "
+                  f"penta {self.penta}, {time.time() - self.start:.0f}s", flush=True)
+            if not self.args.no_sprt and self.decision is None:
+                self.decision = self.sprt.decision(self.penta)
+                if self.decision is not None:
+                    self.stop.set()
+
+    def run(self):
+        print(f"{self.names[0]} vs {self.names[1]}, {len(self.openings)} openings, up to {2 * self.n_pairs} games, "
+              f"{self.args.concurrency} concurrent, options {self.options}")
+        try:
+            with ThreadPoolExecutor(max_workers=self.args.concurrency) as executor:
+                futures = [executor.submit(self.worker) for _ in range(self.args.concurrency)]
+                try:
+                    for future in futures:
+                        future.result()
+                except KeyboardInterrupt:
+                    # Stop before leaving the with block, whose shutdown waits for the workers
+                    self.stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            self.pgn.close()
+            self.log.close()
+
+        elo_diff, margin = elo(self.penta)
+        print(f"Finished {self.games} games in {time.time() - self.start:.0f}s: Elo {elo_diff:+.1f} +- {margin:.1f}")
+        if self.decision == 'H1':
+            print(f"SPRT: H1 accepted, {self.names[0]} is at least {self.args.elo1} Elo stronger")
+        elif self.decision == 'H0':
+            print(f"SPRT: H0 accepted, {self.names[0]} is not {self.args.elo1} Elo stronger")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Play a match between two engines with SPRT early stopping.')
+    parser.add_argument('engine1', type=str, help='Engine under test, e.g. built with the tuned parameters')
+    parser.add_argument('engine2', type=str, help='Reference engine')
+    parser.add_argument('--name1', type=str, default=None, help='Name of engine1 in the PGN')
+    parser.add_argument('--name2', type=str, default=None, help='Name of engine2 in the PGN')
+    parser.add_argument('--openings', type=str, default=None, help='EPD file with opening positions (default: start position)')
+    parser.add_argument('--games', type=int, default=2000, help='Maximum number of games, played in pairs')
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count(), help='Games played at the same time')
+    parser.add_argument('--tc', type=str, default='10+0.1', help='Time control as seconds+increment')
+    parser.add_argument('--nodes', type=int, default=0, help='Search nodes per move instead of the time control')
+    parser.add_argument('--depth', type=int, default=0, help='Search depth per move instead of the time control')
+    parser.add_argument('--time-margin', type=int, default=100, help='Milliseconds an engine may exceed its clock')
+    parser.add_argument('--option', type=str, action='append', default=[], help='UCI option for both engines as Name=Value')
+    parser.add_argument('--resign-score', type=int, default=1000, help='Resign adjudication score in cp')
+    parser.add_argument('--resign-moves', type=int, default=3, help='Moves of each side beyond the resign score')
+    parser.add_argument('--draw-score', type=int, default=10, help='Draw adjudication score in cp')
+    parser.add_argument('--draw-moves', type=int, default=8, help='Moves of each side within the draw score')
+    parser.add_argument('--draw-movenumber', type=int, default=40, help='First move number at which draws are adjudicated')
+    parser.add_argument('--max-moves', type=int, default=300, help='Games longer than this are drawn')
+    parser.add_argument('--elo0', type=float, default=0.0, help='SPRT H0 Elo')
+    parser.add_argument('--elo1', type=float, default=5.0, help='SPRT H1 Elo')
+    parser.add_argument('--alpha', type=float, default=0.05, help='SPRT false positive rate')
+    parser.add_argument('--beta', type=float, default=0.05, help='SPRT false negative rate')
+    parser.add_argument('--no-sprt', action='store_true', help='Play all games')
+    parser.add_argument('--event', type=str, default='Lambergar match', help='PGN Event tag')
+    parser.add_argument('--pgn', type=str, default='match.pgn', help='PGN file, games are appended')
+    parser.add_argument('--log', type=str, default='match.jsonl', help='Per-game JSON lines log, appended')
+    args = parser.parse_args()
+
+    openings = read_openings(args.openings) if args.openings else [chess.STARTING_FEN]
+    Match(args, openings).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import argparse
+import os
+
+import numpy as np
+
+# NumPy implementation of the NNUE of src/nnue.zig. The net file is memory-mapped
+# and every layer is a view into the mapping, nothing is copied or converted when a
+# net is opened. Positions are evaluated in batches with the same integer
+# arithmetic as the engine (wrapping int16 accumulators, clamped uint8 activations,
+# int8 weights with int32 sums, >> 6 between layers and division by 16 rounded
+# towards zero at the output), so the results are the values the engine computes.
+
+# Layout and hashes checked by verify_integrity in src/nnue.zig
+NNUE_VERSION = 0x7AF32F16
+NNUE_HASH = 0x3e5aa6ee
+DESCRIPTION_LENGTH = 177
+TRANSFORMER_HASH = 0x5d69d7b8
+NETWORK_HASH = 0x63337156
+
+L1 = 128
+L2 = 16
+L3 = 16
+FV_SCALE = 16
+
+PS_END = 10 * 64 + 1
+FT_IN_DIM = 64 * PS_END
+FT_OUT_DIM = 2 * L1
+TR_START = 3 * 4 + DESCRIPTION_LENGTH
+NN_START = TR_START + 4 + FT_OUT_DIM + FT_OUT_DIM * FT_IN_DIM
+FILE_SIZE = NN_START + 4 + L2 * 4 + L2 * FT_OUT_DIM + L3 * 4 + L3 * L2 + 4 + L3
+
+WHITE, BLACK = 0, 1
+# Piece codes of position.zig
+PIECE_CODES = {'P': 0, 'N': 1, 'B': 2, 'R': 3, 'Q': 4, 'K': 5, 'p': 8, 'n': 9, 'b': 10, 'r': 11, 'q': 12, 'k': 13}
+KINGS = (5, 13)
+
+# PieceToIndex of nnue.zig: feature offset of a piece code from the point of view of each colour
+PIECE_TO_INDEX = np.zeros((2, 16), dtype=np.int64)
+for _pt in range(5):
+    PIECE_TO_INDEX[WHITE][_pt] = 1 + 2 * _pt * 64
+    PIECE_TO_INDEX[WHITE][8 + _pt] = 1 + (2 * _pt + 1) * 64
+    PIECE_TO_INDEX[BLACK][_pt] = 1 + (2 * _pt + 1) * 64
+    PIECE_TO_INDEX[BLACK][8 + _pt] = 1 + 2 * _pt * 64
+
+
+class Network:
+    def __init__(self, path):
+        self.path = path
+        if os.path.getsize(path) != FILE_SIZE:
+            raise ValueError(f'{path} has {os.path.getsize(path)} bytes, expected {FILE_SIZE}')
+        self.data = np.memmap(path, dtype=np.uint8, mode='r')
+
+        self.version, self.hash, self.description_length = self.data[0:12].view('<u4')
+        self.transformer_hash = self.u32(TR_START)
+        self.network_hash = self.u32(NN_START)
+        for name, value, expected in [
+            ('version', self.version, NNUE_VERSION), ('hash', self.hash, NNUE_HASH),
+            ('description length', self.description_length, DESCRIPTION_LENGTH),
+            ('transformer hash', self.transformer_hash, TRANSFORMER_HASH), ('network hash', self.network_hash, NETWORK_HASH),
+        ]:
+            if value != expected:
+                raise ValueError(f'{path} has {name} {value:#x}, expected {expected:#x}')
+        self.description = bytes(self.data[12:12 + DESCRIPTION_LENGTH]).decode('ascii', errors='replace')
+
+        offset = TR_START + 4
+        self.ft_biases, offset = self.view(offset, '<i2', (L1,))
+        # The bias block is followed by FT_OUT_DIM bytes in total
+        offset = TR_START + 4 + FT_OUT_DIM
+        # One row of L1 weights per feature
+        self.ft_weights, offset = self.view(offset, '<i2', (FT_IN_DIM, L1))
+
+        offset = NN_START + 4
+        self.l1_biases, offset = self.view(offset, '<i4', (L2,))
+        # [output][input], the input is the side to move half followed by the other half
+        self.l1_weights, offset = self.view(offset, 'i1', (L2, FT_OUT_DIM))
+        self.l2_biases, offset = self.view(offset, '<i4', (L3,))
+        self.l2_weights, offset = self.view(offset, 'i1', (L3, L2))
+        self.out_bias, offset = self.view(offset, '<i4', (1,))
+        self.out_weights, offset = self.view(offset, 'i1', (L3,))
+
+    def u32(self, offset):
+        return int(self.data[offset:offset + 4].view('<u4')[0])
+
+    def view(self, offset, dtype, shape):
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        return self.data[offset:offset + size].view(dtype).reshape(shape), offset + size
+
+    def accumulators(self, features):
+        # features: (indptr, index) of active features, one row per position and perspective.
+        # The rows are padded to the same length, so the weights of each row are summed
+        # in one reduction; the sums wrap in int16, which gives the same bits as adding
+        # one feature at a time like the engine.
+        indptr, index = features
+        counts = np.diff(indptr)
+        active = np.arange(max(int(counts.max(initial=0)), 1)) < counts[:, None]
+        padded = np.zeros(active.shape, dtype=np.int64)
+        padded[active] = index
+        weights = self.ft_weights[padded]
+        weights[~active] = 0
+        return self.ft_biases + weights.sum(axis=1, dtype=np.int16)
+
+    def forward(self, acc_us, acc_them):
+        # acc_us, acc_them: int16 accumulators of the player and of the other side
+        x = np.concatenate([np.clip(acc_us, 0, 127), np.clip(acc_them, 0, 127)], axis=1)
+        x = self.affine(x, self.l1_biases, self.l1_weights)
+        x = self.affine(x, self.l2_biases, self.l2_weights)
+        out = int(self.out_bias[0]) + matmul_int(x, self.out_weights[:, None])[:, 0]
+        # @divTrunc
+        return np.sign(out) * (np.abs(out) // FV_SCALE)
+
+    @staticmethod
+    def affine(x, biases, weights):
+        out = biases.astype(np.int64) + matmul_int(x, weights.T)
+        return np.clip(out >> 6, 0, 127)
+
+    def evaluate(self, fens, perspective='stm', batch_size=4096):
+        # Network output for every FEN. perspective 'stm' is what the search uses,
+        # 'white' is the output of the UCI eval command (white's accumulator first).
+        out = np.empty(len(fens), dtype=np.int32)
+        for start in range(0, len(fens), batch_size):
+            batch = fens[start:start + batch_size]
+            features, stm = fen_features(batch)
+            acc = self.accumulators(features).reshape(len(batch), 2, L1)
+            player = stm if perspective == 'stm' else np.zeros(len(batch), dtype=np.int64)
+            rows = np.arange(len(batch))
+            out[start:start + len(batch)] = self.forward(acc[rows, player], acc[rows, 1 - player])
+        return out
+
+
+def matmul_int(x, w):
+    # Integer matrix product through float64, exact since every sum stays far below 2**53
+    return (x.astype(np.float64) @ w.astype(np.float64)).astype(np.int64)
+
+
+def parse_fen(fen):
+    # Squares as in position.zig: a1 = 0, h8 = 63
+    parts = fen.split()
+    pieces = []
+    for rank_index, rank in enumerate(parts[0].split('/')):
+        file = 0
+        for c in rank:
+            if c.isdigit():
+                file += int(c)
+            else:
+                pieces.append(((7 - rank_index) * 8 + file, PIECE_CODES[c]))
+                file += 1
+    stm = WHITE if len(parts) < 2 or parts[1] == 'w' else BLACK
+    return pieces, stm
+
+
+def fen_features(fens):
+    # Active feature indices (make_index of nnue.zig) of every position, white
+    # perspective row followed by black perspective row
+    index, indptr, stm = [], [0], np.empty(len(fens), dtype=np.int64)
+    for i, fen in enumerate(fens):
+        pieces, stm[i] = parse_fen(fen)
+        kings = {code: sq for sq, code in pieces if code in KINGS}
+        for color in (WHITE, BLACK):
+            orient = 0 if color == WHITE else 0x3F
+            king = (kings[KINGS[color]] ^ orient) * PS_END
+            index += [(sq ^ orient) + PIECE_TO_INDEX[color][code] + king for sq, code in pieces if code not in KINGS]
+            indptr.append(len(index))
+    return (np.array(indptr, dtype=np.int64), np.array(index, dtype=np.int64)), stm
+
+
+def read_fens(path):
+    with open(path, 'r') as file:
+        # Labelled EPD lines end with the result, e.g. "... w - - [0.5]"
+        return [line.split('[')[0].strip() for line in file if line.strip()]
+
+
+def describe(net):
+    print(f"File: {net.path} ({FILE_SIZE} bytes)")
+    print(f"Version {net.version:#x}, hash {net.hash:#x}, transformer hash {net.transformer_hash:#x}, network hash {net.network_hash:#x}")
+    print(f"Description: {net.description.strip(chr(0)).strip()}")
+    print(f"Architecture: {FT_IN_DIM} -> {L1}x2 -> {L2} -> {L3} -> 1")
+    for name in ['ft_biases', 'ft_weights', 'l1_biases', 'l1_weights', 'l2_biases', 'l2_weights', 'out_bias', 'out_weights']:
+        array = getattr(net, name)
+        print(f"  {name:12s} {str(array.dtype):6s} {str(array.shape):14s} min {int(array.min()):7d} max {int(array.max()):7d} "
+              f"mean |w| {np.abs(array.astype(np.float64)).mean():9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect an NNUE file and evaluate positions with it.')
+    parser.add_argument('net', type=str, nargs='?', default=os.path.join('..', 'src', 'cop.nnue'), help='NNUE file')
+    parser.add_argument('--fen', type=str, action='append', default=[], help='Position to evaluate')
+    parser.add_argument('--epd', type=str, default=None, help='File with positions to evaluate')
+    parser.add_argument('--store', type=str, default=None, help='Feature store whose positions are evaluated')
+    parser.add_argument('--perspective', type=str, choices=['stm', 'white'], default='stm', help='stm as in search, white as the UCI eval command')
+    parser.add_argument('--output', type=str, default=None, help='Save the evaluations as .npy (or text with one line per position)')
+    parser.add_argument('--compare', type=str, default=None, help='Second net evaluated on the same positions')
+    parser.add_argument('--batch-size', type=int, default=4096, help='Positions evaluated together')
+    args = parser.parse_args()
+
+    net = Network(args.net)
+    describe(net)
+
+    fens = list(args.fen)
+    if args.epd:
+        fens += read_fens(args.epd)
+    if args.store:
+        from feature_store import FeatureStore
+        fens += FeatureStore(args.store).fens()
+    if not fens:
+        return
+
+    evals = net.evaluate(fens, args.perspective, args.batch_size)
+    if args.output and args.output.endswith('.npy'):
+        np.save(args.output, evals)
+    elif args.output:
+        with open(args.output, 'w') as file:
+            for fen, value in zip(fens, evals):
+                file.write(f'{fen}\t{value}\n')
+    elif len(fens) <= 20:
+        for fen, value in zip(fens, evals):
+            print(f"{value:6d}  {fen}")
+    print(f"Evaluated {len(fens)} positions: mean {evals.mean():.1f}, std {evals.std():.1f}")
+
+    if args.compare:
+        other = Network(args.compare).evaluate(fens, args.perspective, args.batch_size)
+        diff = other.astype(np.int64) - evals
+        corr = np.corrcoef(evals, other)[0, 1] if len(fens) > 1 else float('nan')
+        print(f"{args.compare} - {args.net}: mean {diff.mean():.1f}, mean |diff| {np.abs(diff).mean():.1f}, "
+              f"max |diff| {np.abs(diff).max()}, correlation {corr:.4f}")
+
+
+if __name__ == "__main__":
+    main()
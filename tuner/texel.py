@@ -0,0 +1,170 @@
+import numpy as np
+import scipy.sparse as sp
+
+# Sparse training engine for the Texel logistic model of tune_parameters.ipynb.
+#
+# The model is unchanged: for a position with feature differences x (white - black)
+# and phase ph, the predicted score is
+#
+#     sigmoid(K * (ph * x.w_mg + (1 - ph) * x.w_eg))
+#
+# but x is kept as a CSR matrix and the phase weights [ph, 1 - ph] are computed once,
+# so an epoch costs two sparse products (X @ W and X.T @ G) instead of dense
+# einsum/linear passes over mostly zero columns.
+
+K = 0.00916
+PIECE_VALUES = [100.0, 300.0, 325.0, 500.0, 900.0]
+
+# Lengths of each field in mg_params.txt / eg_params.txt
+LENGTH_OF_FIELDS = [6, 64, 64, 64, 64, 64, 64, 64, 8, 8, 8, 8, 9, 14, 15, 28, 6, 6, 6, 6, 6, 1, 1]
+
+
+class SparseDataset:
+    def __init__(self, x, phase, result):
+        self.x = x
+        self.phase = phase
+        self.result = result
+        # Column 0 weights the mg vector and column 1 the eg vector
+        self.phase_weights = np.stack([phase, 1 - phase], axis=1).astype(np.float32)
+
+    def __len__(self):
+        return self.x.shape[0]
+
+    def subset(self, rows):
+        return SparseDataset(self.x[rows], self.phase[rows], self.result[rows])
+
+
+def load_dataset(store, start=0, stop=None, chunk_size=1_000_000, rows=None):
+    # Builds X = white - black from the (feature index, count) pairs of a FeatureStore,
+    # rows (relative to start) selects positions before invalid labels are dropped
+    stop = len(store) if stop is None else stop
+    n = store.n_features
+    n_rows = stop - start
+    max_entries = int(store.row_offsets[stop]) - int(store.row_offsets[start])
+
+    index_dtype = np.int32 if max_entries < np.iinfo(np.int32).max else np.int64
+    data = np.empty(max_entries, dtype=np.float32)
+    indices = np.empty(max_entries, dtype=index_dtype)
+    indptr = np.zeros(n_rows + 1, dtype=index_dtype)
+
+    nnz = 0
+    for lo in range(start, stop, chunk_size):
+        hi = min(lo + chunk_size, stop)
+        row_ptr, index, count = store.rows(lo, hi)
+
+        black = index >= n
+        chunk = sp.csr_matrix(
+            (np.where(black, -count.astype(np.float32), count.astype(np.float32)),
+             np.where(black, index - n, index).astype(index_dtype),
+             row_ptr.astype(index_dtype)),
+            shape=(hi - lo, n))
+        # White and black counts of the same feature collapse into one difference
+        chunk.sum_duplicates()
+        chunk.eliminate_zeros()
+
+        data[nnz:nnz + chunk.nnz] = chunk.data
+        indices[nnz:nnz + chunk.nnz] = chunk.indices
+        indptr[lo - start + 1:hi - start + 1] = chunk.indptr[1:] + nnz
+        nnz += chunk.nnz
+
+    x = sp.csr_matrix((data[:nnz], indices[:nnz], indptr), shape=(n_rows, n))
+
+    phase = (np.clip(store.phase[start:stop, 0], 0, 32).astype(np.float32) + np.clip(store.phase[start:stop, 1], 0, 32)) / 64
+    if store.target is not None:
+        result = np.asarray(store.target[start:stop], dtype=np.float32)
+    else:
+        result = (store.result[start:stop].astype(np.float32) + 1) / 2
+        # Result 10 marks a line whose label was not recognised
+        result[np.abs(store.result[start:stop]) > 1] = np.nan
+
+    if rows is not None:
+        x, phase, result = x[rows], phase[rows], result[rows]
+
+    # Positions without a valid label would make the loss and every weight NaN
+    valid = np.isfinite(result)
+    if not valid.all():
+        return SparseDataset(x[valid], phase[valid], result[valid].astype(np.float32))
+    return SparseDataset(x, phase, result.astype(np.float32))
+
+
+class LogisticModel:
+    def __init__(self, input_dim):
+        # weights[:, 0] are the mg parameters (linear1), weights[:, 1] the eg parameters (linear2)
+        self.weights = np.zeros((input_dim, 2), dtype=np.float32)
+        self.initialize_weights()
+
+    def initialize_weights(self):
+        self.weights[:] = 0
+        self.weights[:len(PIECE_VALUES), 0] = PIECE_VALUES
+        self.weights[:len(PIECE_VALUES), 1] = PIECE_VALUES
+
+    @property
+    def mg(self):
+        return self.weights[:, 0]
+
+    @property
+    def eg(self):
+        return self.weights[:, 1]
+
+    def forward(self, data):
+        z = K * np.einsum('ij,ij->i', data.x @ self.weights, data.phase_weights)
+        return 1 / (1 + np.exp(-z))
+
+    def loss_and_grad(self, data, beta=0.25):
+        # Mean SmoothL1 loss (same as torch.nn.SmoothL1Loss(beta)) and its gradient
+        pred = self.forward(data)
+        diff = pred - data.result
+        abs_diff = np.abs(diff)
+        small = abs_diff < beta
+
+        loss = np.where(small, 0.5 * diff * diff / beta, abs_diff - 0.5 * beta).mean()
+        mse = np.mean(diff * diff)
+
+        g = np.where(small, diff / beta, np.sign(diff)) * pred * (1 - pred) / len(data)
+        grad = K * (data.x.T @ (g[:, None] * data.phase_weights))
+
+        return loss, mse, grad.astype(np.float32), pred
+
+
+class Adam:
+    # torch.optim.Adam with default settings, so that runs reproduce the notebook
+    def __init__(self, params, lr=0.25, betas=(0.9, 0.999), eps=1e-8):
+        self.params = params
+        self.lr = lr
+        self.beta1, self.beta2 = betas
+        self.eps = eps
+        self.step_count = 0
+        self.exp_avg = np.zeros_like(params)
+        self.exp_avg_sq = np.zeros_like(params)
+
+    def step(self, grad):
+        self.step_count += 1
+        self.exp_avg += (1 - self.beta1) * (grad - self.exp_avg)
+        self.exp_avg_sq *= self.beta2
+        self.exp_avg_sq += (1 - self.beta2) * grad * grad
+
+        bias_correction1 = 1 - self.beta1 ** self.step_count
+        bias_correction2 = 1 - self.beta2 ** self.step_count
+
+        denom = np.sqrt(self.exp_avg_sq) / np.sqrt(bias_correction2) + self.eps
+        self.params -= (self.lr / bias_correction1) * self.exp_avg / denom
+
+    def state_dict(self):
+        return {'step': self.step_count, 'exp_avg': self.exp_avg, 'exp_avg_sq': self.exp_avg_sq}
+
+    def load_state_dict(self, state):
+        self.step_count = int(state['step'])
+        self.exp_avg[:] = state['exp_avg']
+        self.exp_avg_sq[:] = state['exp_avg_sq']
+
+
+def write_params(vector, path, length_of_fields=LENGTH_OF_FIELDS):
+    # One {..} line per field, in the order of mg_params.txt / eg_params.txt
+    vector = np.asarray(vector).astype(int).reshape(-1)
+    with open(path, 'w') as file:
+        start_index = 0
+        for field_length in length_of_fields:
+            field_vector = vector[start_index:(start_index + field_length)]
+            file.write('{')
+            file.write(', '.join(map(str, field_vector)) + '}\n')
+            start_index += field_length
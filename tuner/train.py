@@ -0,0 +1,225 @@
+import argparse
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from feature_store import FeatureStore
+import texel
+
+# Mini-batch trainer for the Texel model. Positions are streamed chunk by chunk from
+# one or more feature stores, so only the chunks in the prefetch queue are ever in
+# memory. A fixed part of the rows of every chunk is held out to decide when to stop,
+# and the full optimizer state is checkpointed so that an interrupted run can be resumed.
+
+
+def make_chunks(stores, chunk_size):
+    chunks = []
+    for s, store in enumerate(stores):
+        for start in range(0, len(store), chunk_size):
+            chunks.append((s, start, min(start + chunk_size, len(store))))
+    return chunks
+
+
+def split_rows(chunk, holdout, seed):
+    # Training and validation rows of a chunk. The mask is drawn from a seed of its
+    # own, so it is the same in every epoch and after resuming.
+    s, start, stop = chunk
+    val = np.random.default_rng([seed, s, start]).random(stop - start) < holdout
+    return np.flatnonzero(~val), np.flatnonzero(val)
+
+
+def batches_in(n_rows, batch_size):
+    return (n_rows + batch_size - 1) // batch_size
+
+
+class BatchPrefetcher:
+    # Background worker that loads and shuffles chunks and queues their mini-batches.
+    # The order only depends on the seed and epoch, which is what makes resuming exact.
+    def __init__(self, stores, chunks, batch_size, holdout, seed, epoch, skip_batches=0, depth=4):
+        self.queue = queue.Queue(maxsize=depth)
+        self.stop = threading.Event()
+        self.thread = threading.Thread(
+            target=self.run, args=(stores, chunks, batch_size, holdout, seed, epoch, skip_batches), daemon=True)
+        self.thread.start()
+
+    def run(self, stores, chunks, batch_size, holdout, seed, epoch, skip_batches):
+        try:
+            rng = np.random.default_rng([seed, epoch])
+            for c in rng.permutation(len(chunks)):
+                chunk = chunks[c]
+                perm_seed = rng.integers(1 << 62)
+                train_rows, _ = split_rows(chunk, holdout, seed)
+                n_batches = batches_in(len(train_rows), batch_size)
+                if skip_batches >= n_batches:
+                    skip_batches -= n_batches
+                    continue
+
+                s, start, stop = chunk
+                data = texel.load_dataset(stores[s], start, stop, rows=train_rows)
+                rows = np.random.default_rng(perm_seed).permutation(len(data))
+                for b in range(skip_batches, n_batches):
+                    if self.stop.is_set():
+                        return
+                    self.queue.put(data.subset(rows[b * batch_size:(b + 1) * batch_size]))
+                skip_batches = 0
+            self.queue.put(None)
+        except Exception as e:
+            self.queue.put(e)
+
+    def __iter__(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def close(self):
+        self.stop.set()
+        while self.thread.is_alive():
+            try:
+                self.queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def evaluate(model, stores, chunks, beta, holdout, seed, validation=True):
+    total_loss, total_mse, total = 0.0, 0.0, 0
+    for chunk in chunks:
+        rows = split_rows(chunk, holdout, seed)[1 if validation else 0]
+        if len(rows) == 0:
+            continue
+        s, start, stop = chunk
+        data = texel.load_dataset(stores[s], start, stop, rows=rows)
+        if len(data) == 0:
+            continue
+        loss, mse, _, _ = model.loss_and_grad(data, beta)
+        total_loss += loss * len(data)
+        total_mse += mse * len(data)
+        total += len(data)
+    return total_loss / max(total, 1), total_mse / max(total, 1)
+
+
+def save_checkpoint(path, state):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        np.savez(file, **state)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with np.load(path) as checkpoint:
+        return {key: checkpoint[key] for key in checkpoint.files}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the Texel model on sparse feature stores.')
+    parser.add_argument('stores', type=str, nargs='*', default=['data'], help='Feature store directories')
+    parser.add_argument('--epochs', type=int, default=100, help='Maximum number of passes over the training chunks')
+    parser.add_argument('--batch-size', type=int, default=16384, help='Positions per mini-batch')
+    parser.add_argument('--chunk-size', type=int, default=262144, help='Positions loaded and shuffled together')
+    parser.add_argument('--lr', type=float, default=0.25, help='Adam learning rate')
+    parser.add_argument('--beta', type=float, default=0.25, help='SmoothL1 loss beta')
+    parser.add_argument('--holdout', type=float, default=0.05, help='Fraction of positions used for validation')
+    parser.add_argument('--patience', type=int, default=5, help='Epochs without validation improvement before stopping')
+    parser.add_argument('--min-delta', type=float, default=1e-7, help='Smallest validation loss decrease that counts')
+    parser.add_argument('--prefetch', type=int, default=8, help='Mini-batches queued by the prefetch worker')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the holdout split and shuffling')
+    parser.add_argument('--log-every', type=int, default=50, help='Steps between progress lines')
+    parser.add_argument('--checkpoint', type=str, default='train_checkpoint.npz', help='Checkpoint file')
+    parser.add_argument('--checkpoint-every', type=int, default=500, help='Steps between checkpoints')
+    parser.add_argument('--resume', action='store_true', help='Continue from the checkpoint file')
+    parser.add_argument('--output-mg', type=str, default='output_mg.txt', help='Exported mg parameters')
+    parser.add_argument('--output-eg', type=str, default='output_eg.txt', help='Exported eg parameters')
+    args = parser.parse_args()
+
+    stores = [FeatureStore(path) for path in args.stores]
+    n_features = stores[0].n_features
+    if any(store.n_features != n_features for store in stores):
+        raise ValueError('Feature stores have different feature layouts')
+
+    chunks = make_chunks(stores, args.chunk_size)
+    splits = [split_rows(chunk, args.holdout, args.seed) for chunk in chunks]
+    n_train = sum(len(train_rows) for train_rows, _ in splits)
+    n_val = sum(len(val_rows) for _, val_rows in splits)
+    steps_per_epoch = sum(batches_in(len(train_rows), args.batch_size) for train_rows, _ in splits)
+    del splits
+    print(f"Training positions: {n_train}, validation positions: {n_val}, steps per epoch: {steps_per_epoch}")
+
+    model = texel.LogisticModel(n_features)
+    optimizer = texel.Adam(model.weights, lr=args.lr)
+    epoch, epoch_step = 0, 0
+    best_loss, best_weights, bad_epochs = np.inf, model.weights.copy(), 0
+
+    if args.resume and os.path.exists(args.checkpoint):
+        state = load_checkpoint(args.checkpoint)
+        if (int(state['seed']) != args.seed or int(state['batch_size']) != args.batch_size
+                or int(state['chunk_size']) != args.chunk_size or float(state.get('holdout', -1)) != args.holdout):
+            raise ValueError('Checkpoint was written with a different seed, batch size, chunk size or holdout')
+        model.weights[:] = state['weights']
+        optimizer.load_state_dict({key[len('adam_'):]: state[key] for key in state if key.startswith('adam_')})
+        epoch, epoch_step = int(state['epoch']), int(state['epoch_step'])
+        best_loss, best_weights, bad_epochs = float(state['best_loss']), state['best_weights'], int(state['bad_epochs'])
+        print(f"Resumed from {args.checkpoint} at epoch {epoch}, step {epoch_step}")
+
+    def checkpoint():
+        state = {
+            'weights': model.weights, 'epoch': epoch, 'epoch_step': epoch_step,
+            'best_loss': best_loss, 'best_weights': best_weights, 'bad_epochs': bad_epochs,
+            'seed': args.seed, 'batch_size': args.batch_size, 'chunk_size': args.chunk_size, 'holdout': args.holdout,
+        }
+        state.update({'adam_' + key: value for key, value in optimizer.state_dict().items()})
+        save_checkpoint(args.checkpoint, state)
+
+    while epoch < args.epochs and bad_epochs < args.patience:
+        prefetcher = BatchPrefetcher(stores, chunks, args.batch_size, args.holdout, args.seed, epoch, epoch_step, args.prefetch)
+        interval_start, interval_positions, interval_loss, interval_steps = time.time(), 0, 0.0, 0
+        try:
+            for batch in prefetcher:
+                if len(batch) == 0:
+                    # The positions of this batch were dropped for invalid labels
+                    epoch_step += 1
+                    continue
+                loss, mse, grad, _ = model.loss_and_grad(batch, args.beta)
+                optimizer.step(grad)
+                epoch_step += 1
+
+                interval_positions += len(batch)
+                interval_loss += loss
+                interval_steps += 1
+                if epoch_step % args.log_every == 0:
+                    elapsed = time.time() - interval_start
+                    print(f"epoch = {epoch}, step = {epoch_step}/{steps_per_epoch}, loss = {interval_loss / interval_steps:.6f}, "
+                          f"{interval_positions / elapsed:.0f} positions/s")
+                    print(f"Piece val mg: {model.mg[0:5].astype(int)}, Piece val eg: {model.eg[0:5].astype(int)}")
+                    interval_start, interval_positions, interval_loss, interval_steps = time.time(), 0, 0.0, 0
+
+                if epoch_step % args.checkpoint_every == 0:
+                    checkpoint()
+        finally:
+            prefetcher.close()
+
+        val_loss, val_mse = evaluate(model, stores, chunks, args.beta, args.holdout, args.seed, validation=n_val > 0)
+        if val_loss < best_loss - args.min_delta:
+            best_loss, best_weights, bad_epochs = val_loss, model.weights.copy(), 0
+        else:
+            bad_epochs += 1
+        print(f"epoch = {epoch} done, validation loss = {val_loss:.6f}, mse = {val_mse:.6f}, best = {best_loss:.6f}")
+
+        epoch, epoch_step = epoch + 1, 0
+        checkpoint()
+
+    if bad_epochs >= args.patience:
+        print(f"Stopped early, no improvement for {bad_epochs} epochs")
+
+    texel.write_params(best_weights[:, 0], args.output_mg)
+    texel.write_params(best_weights[:, 1], args.output_eg)
+    print(f"Best validation loss {best_loss:.6f}, parameters written to {args.output_mg} and {args.output_eg}")
+
+
+if __name__ == "__main__":
+    main()
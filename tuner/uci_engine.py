@@ -0,0 +1,166 @@
+import queue
+import subprocess
+import threading
+
+# Minimal UCI client used by the benchmark, match and labelling scripts. The engine
+# runs as a child process; its output is read by a background thread, so every
+# wait can have a timeout and a crashed engine is noticed instead of hanging.
+
+
+class EngineError(RuntimeError):
+    pass
+
+
+# info keys followed by one number
+INFO_INTS = {'depth', 'seldepth', 'multipv', 'nodes', 'nps', 'time', 'hashfull', 'tbhits', 'currmovenumber'}
+INFO_FLOATS = {'mbf', 'bc'}
+
+
+def parse_info(line):
+    # "info score cp 20 depth 10 ... pv e2e4 e7e5" -> {'score': ('cp', 20), 'depth': 10, ..., 'pv': ['e2e4', 'e7e5']}
+    words = line.split()
+    info = {}
+    i = 1
+    while i < len(words):
+        key = words[i]
+        if key == 'score' and i + 2 < len(words):
+            info['score'] = (words[i + 1], int(words[i + 2]))
+            i += 3
+            # lowerbound / upperbound
+            while i < len(words) and words[i] in ('lowerbound', 'upperbound'):
+                info[words[i]] = True
+                i += 1
+        elif key == 'pv':
+            info['pv'] = words[i + 1:]
+            break
+        elif key == 'string':
+            info['string'] = ' '.join(words[i + 1:])
+            break
+        elif key in INFO_INTS and i + 1 < len(words):
+            info[key] = int(words[i + 1])
+            i += 2
+        elif key in INFO_FLOATS and i + 1 < len(words):
+            info[key] = float(words[i + 1])
+            i += 2
+        else:
+            i += 1
+    return info
+
+
+def score_cp(score, mate_value=100000):
+    # Centipawns of an info score, mates as +-mate_value
+    kind, value = score
+    if kind == 'mate':
+        return mate_value if value > 0 else -mate_value
+    return value
+
+
+class UciEngine:
+    def __init__(self, path, options=None, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        self.process = subprocess.Popen([path], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        self.lines = queue.Queue()
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+        self.name = path
+        try:
+            self.send('uci')
+            for line in self.wait_for('uciok'):
+                if line.startswith('id name '):
+                    self.name = line[len('id name '):]
+
+            for name, value in (options or {}).items():
+                self.set_option(name, value)
+            self.isready()
+        except BaseException:
+            # Killing the process also ends the reader thread
+            self.process.kill()
+            self.process.wait()
+            raise
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.lines.put(line.rstrip('\r\n'))
+        self.lines.put(None)
+
+    def send(self, command):
+        try:
+            self.process.stdin.write(command + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            raise EngineError(f'{self.name} is not running (exit code {self.process.poll()})')
+
+    def read_line(self, timeout=None):
+        try:
+            line = self.lines.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f'{self.name} did not answer in {timeout}s')
+        if line is None:
+            raise EngineError(f'{self.name} exited with code {self.process.wait()}')
+        return line
+
+    def wait_for(self, prefix, timeout=None):
+        # Lines read until (and including) the first one starting with prefix
+        timeout = self.timeout if timeout is None else timeout
+        lines = []
+        while True:
+            line = self.read_line(timeout)
+            lines.append(line)
+            if line.startswith(prefix):
+                return lines
+
+    def isready(self, timeout=None):
+        self.send('isready')
+        self.wait_for('readyok', timeout)
+
+    def set_option(self, name, value):
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        self.send(f'setoption name {name} value {value}')
+
+    def new_game(self):
+        self.send('ucinewgame')
+        self.isready()
+
+    def position(self, fen=None, moves=()):
+        command = f'position fen {fen}' if fen else 'position startpos'
+        if moves:
+            command += ' moves ' + ' '.join(moves)
+        self.send(command)
+
+    def go(self, timeout=None, **limits):
+        # go depth=10 / nodes=... / movetime=... / wtime=... btime=... winc=... binc=...
+        # Returns the bestmove and the parsed info lines of the search
+        self.send('go ' + ' '.join(f'{key} {value}' for key, value in limits.items()))
+        infos, bestmove = [], None
+        while bestmove is None:
+            line = self.read_line(self.timeout if timeout is None else timeout)
+            if line.startswith('info '):
+                infos.append(parse_info(line))
+            elif line.startswith('bestmove'):
+                words = line.split()
+                bestmove = words[1] if len(words) > 1 else '0000'
+        return bestmove, infos
+
+    def command(self, command, last_prefix, timeout=None):
+        # Sends a non-standard command (bench, perft, eval) and returns its output
+        self.send(command)
+        return self.wait_for(last_prefix, timeout)
+
+    def quit(self, timeout=5.0):
+        if self.process.poll() is None:
+            try:
+                self.send('quit')
+                self.process.wait(timeout)
+            except (EngineError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.quit()